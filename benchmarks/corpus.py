@@ -0,0 +1,489 @@
+"""Offline corpus of vlr.gg pages for the benchmarks.
+
+The pages are generated, not recorded: they reproduce the markup the parsers
+in `src.scraper` read (match header, map navigation, rounds rows, overview and
+economy tables, team match lists, the home page's match cards), padded with
+unrelated markup to about the node count of a real page. `write_corpus` writes
+the checked-in cases to `benchmarks/fixtures`, `build_site` builds a larger
+site in memory for end to end runs.
+
+    python -m benchmarks.corpus            # regenerate benchmarks/fixtures
+"""
+
+import json
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+MANIFEST = "manifest.json"
+
+MAPS = ["Ascent", "Bind", "Haven", "Lotus", "Split", "Sunset", "Icebox"]
+AGENTS = ["jett", "sova", "omen", "killjoy", "skye", "raze", "viper", "kayo"]
+HEADERS = ["", "", "R2.0", "ACS", "K", "D", "A", "+/–", "KAST", "ADR", "HS%", "FK", "FD", "+/–"]
+REASONS = ["elim", "boom", "defuse", "time"]
+ECONOMY = "?game=all&tab=economy"
+
+
+@dataclass
+class Team:
+    team_id: int
+    name: str
+    tag: str
+    core_id: int = 1
+
+    @property
+    def slug(self) -> str:
+        return self.name.lower().replace(" ", "-")
+
+    @property
+    def path(self) -> str:
+        return f"team/{self.team_id}/{self.slug}"
+
+    @property
+    def matches_path(self) -> str:
+        return f"team/matches/{self.team_id}/{self.slug}"
+
+
+@dataclass
+class MatchSpec:
+    match_id: int
+    teams: tuple[Team, Team]
+    n_maps: int = 3
+    overtime_rounds: int = 0
+    patch: str = "9.10"
+    seed: int = 0
+    date: str = "2025-01-01 12:00:00"
+
+    @property
+    def path(self) -> str:
+        return f"{self.match_id}/{self.teams[0].slug}-vs-{self.teams[1].slug}"
+
+
+@dataclass
+class Site:
+    """Pages by url path relative to the site root (no leading slash,
+    query included), plus the specs they were generated from."""
+
+    pages: dict[str, str] = field(default_factory=dict)
+    teams: list[Team] = field(default_factory=list)
+    matches: list[MatchSpec] = field(default_factory=list)
+
+
+def _filler(rng: random.Random, n: int) -> str:
+    # stands in for the navigation, sidebars and comment threads of a real
+    # page, which the parsers have to walk past
+    posts = "".join(
+        f'<div class="post"><div class="post-header"><a class="post-header-author">'
+        f'user{rng.randrange(10_000)}</a><span class="js-date-toggle">{i}h ago</span></div>'
+        f'<div class="post-body"><p>{" ".join(rng.choice(AGENTS) for _ in range(12))}</p>'
+        f'</div><div class="post-footer"><a class="post-action">reply</a></div></div>'
+        for i in range(n)
+    )
+    return f'<div id="comments" class="wf-card">{posts}</div>'
+
+
+def _stat_cell(values: list[str]) -> str:
+    spans = "".join(
+        f'<span class="side mod-side mod-{side}">{value}</span>'
+        for side, value in zip(["both", "t", "ct"], values)
+    )
+    return f'<td class="mod-stat"><span class="stats-sq">{spans}</span></td>'
+
+
+def _stat_values(rng: random.Random, header: str) -> list[str]:
+    if header == "R2.0":
+        values = [f"{rng.uniform(0.5, 1.6):.2f}" for _ in range(3)]
+    elif header in ("KAST", "HS%"):
+        values = [f"{rng.randint(10, 90)}%" for _ in range(3)]
+    elif header == "+/–":
+        values = [f"{rng.randint(-8, 8):+d}" for _ in range(3)]
+    else:
+        values = [str(rng.randint(0, 250)) for _ in range(3)]
+    if rng.random() < 0.05:
+        # side stats vlr.gg doesn't have for a player
+        values[rng.randint(1, 2)] = "&nbsp;"
+    return values
+
+
+def _overview_table(rng: random.Random, team: Team) -> str:
+    rows = []
+    for i, agent in enumerate(rng.sample(AGENTS, 5)):
+        cells = [
+            f'<td class="mod-player"><a href="/player/{team.team_id}{i}/">'
+            f'<div class="text-of">{team.tag}p{i}</div>'
+            f'<div class="ge-text-light">{team.tag}</div></a></td>',
+            f'<td class="mod-agents"><span><img alt="{agent}" title="{agent}" '
+            f'src="/img/vlr/game/agents/{agent}.png"></span></td>',
+        ]
+        cells += [_stat_cell(_stat_values(rng, header)) for header in HEADERS[2:]]
+        rows.append("<tr>" + "".join(cells) + "</tr>")
+    head = "".join(f"<th>{header}</th>" for header in HEADERS)
+    return (
+        '<table class="wf-table-inset mod-overview"><thead><tr>'
+        f"{head}</tr></thead><tbody>{''.join(rows)}</tbody></table>"
+    )
+
+
+def _play_map(rng: random.Random, overtime_rounds: int) -> list[tuple[int, int, tuple]]:
+    """(round number, winning team index, score after the round). Team 0
+    attacks first."""
+    rounds, score = [], [0, 0]
+    if overtime_rounds:
+        # 12-12, then overtime until someone is two rounds ahead
+        winners = [n % 2 for n in range(24)]
+        winners += [k % 2 for k in range(overtime_rounds - 2)] + [0, 0]
+    else:
+        winners = []
+        while max(score) < 13 and len(winners) < 24:
+            winner = rng.randint(0, 1)
+            winners.append(winner)
+            score[winner] += 1
+            if score == [12, 12]:
+                winners += [0, 0]
+                break
+        score = [0, 0]
+    for n, winner in enumerate(winners, start=1):
+        score[winner] += 1
+        rounds.append((n, winner, tuple(score)))
+    return rounds
+
+
+def _side(team: int, round_num: int) -> str:
+    if round_num <= 12:
+        attacker = 0
+    elif round_num <= 24:
+        attacker = 1
+    else:
+        attacker = (round_num - 25) % 2
+    return "t" if team == attacker else "ct"
+
+
+def _rounds_rows(rng: random.Random, tags: tuple[str, str], rounds: list) -> str:
+    def column(round_num: int, winner: int, score: tuple) -> str:
+        squares = ""
+        for team in range(2):
+            if team == winner:
+                reason = rng.choice(REASONS)
+                squares += (
+                    f'<div class="rnd-sq mod-win mod-{_side(team, round_num)}">'
+                    f'<img src="/img/vlr/game/round/{reason}.webp"></div>'
+                )
+            else:
+                squares += '<div class="rnd-sq"></div>'
+        return (
+            f'<div class="vlr-rounds-row-col" title="{score[0]}-{score[1]}">'
+            f'<div class="rnd-num">{round_num}</div>{squares}</div>'
+        )
+
+    teams = (
+        '<div class="vlr-rounds-row-col"><div class="rnd-num">&nbsp;</div>'
+        f'<div class="team">{tags[0]}</div><div class="team">{tags[1]}</div></div>'
+    )
+    regulation = '<div class="vlr-rounds-row">' + teams
+    for round_num, winner, score in rounds[:24]:
+        regulation += column(round_num, winner, score)
+        if round_num == 12:
+            regulation += '<div class="vlr-rounds-row-col mod-spacing"></div>'
+    rows = regulation + "</div>"
+    if len(rounds) > 24:
+        rows += (
+            '<div class="vlr-rounds-row">'
+            + teams
+            + "".join(column(*r) for r in rounds[24:])
+            + "</div>"
+        )
+    return f'<div class="vlr-rounds">{rows}</div>'
+
+
+def _economy_table(tags: tuple[str, str], rounds: list) -> str:
+    rows = ""
+    for half in (rounds[:12], rounds[12:24], rounds[24:]):
+        if not half:
+            continue
+        cells = f'<td><div class="team">{tags[0]}</div><div class="team">{tags[1]}</div></td>'
+        for round_num, winner, _ in half:
+            cells += "<td>"
+            for team in range(2):
+                classes = "rnd-sq"
+                if team == winner:
+                    classes += f" mod-win mod-{_side(team, round_num)}"
+                buy = ["", "$", "$$", "$$$"][(round_num * 7 + team * 3 + winner) % 4]
+                cells += f'<div class="{classes}">{buy}</div>'
+            cells += "</td>"
+        rows += f"<tr>{cells}</tr>"
+    return (
+        '<div style="overflow-x: auto;"><table class="wf-table-inset mod-econ-summary">'
+        "</table></div>"
+        '<div style="overflow-x: auto;"><table class="wf-table-inset mod-econ">'
+        f"{rows}</table></div>"
+    )
+
+
+def match_pages(spec: MatchSpec, filler: int = 150) -> tuple[str, str]:
+    """The match page and its economy tab."""
+    rng = random.Random(spec.seed)
+    teams, tags = spec.teams, (spec.teams[0].tag, spec.teams[1].tag)
+    maps = rng.sample(MAPS, spec.n_maps)
+    map_wins = [0, 0]
+    games, economies = "", ""
+    nav = (
+        '<div class="vm-stats-gamesnav-item js-map-switch" data-game-id="all">'
+        "All Maps</div>"
+    )
+    for i, map_name in enumerate(maps):
+        # the decider of a series isn't always played out on vlr.gg
+        needed = spec.n_maps // 2 + 1
+        game_id = spec.match_id * 10 + i
+        if max(map_wins) == needed:
+            nav += (
+                '<div class="vm-stats-gamesnav-item js-map-switch" '
+                f'data-game-id="{game_id}" data-disabled="1">'
+                f"<div><span>{i + 1}</span>\n{map_name}</div></div>"
+            )
+            continue
+        rounds = _play_map(rng, spec.overtime_rounds if i == 0 else 0)
+        final = rounds[-1][2]
+        map_wins[0 if final[0] > final[1] else 1] += 1
+        header = "".join(
+            f'<div class="team"><div class="team-name">{teams[t].name}</div>'
+            f'<div class="score">{final[t]}</div></div>'
+            for t in range(2)
+        )
+        active = " mod-active" if not games else ""
+        games += (
+            f'<div class="vm-stats-game{active}" data-game-id="{game_id}">'
+            f'<div class="vm-stats-game-header">{header}'
+            f'<div class="map"><span>{map_name}</span></div></div>'
+            + _rounds_rows(rng, tags, rounds)
+            + _overview_table(rng, teams[0])
+            + _overview_table(rng, teams[1])
+            + "</div>"
+        )
+        economies += (
+            f'<div class="vm-stats-game" data-game-id="{game_id}">'
+            + _economy_table(tags, rounds)
+            + "</div>"
+        )
+        nav += (
+            '<div class="vm-stats-gamesnav-item js-map-switch" '
+            f'data-game-id="{game_id}"><div><span>{i + 1}</span>\n{map_name}</div></div>'
+        )
+
+    patch = ""
+    if spec.patch:
+        patch = (
+            '<div style="margin-top: 4px;">'
+            f'<div style="font-style: italic;">Patch {spec.patch}</div></div>'
+        )
+    picks = "; ".join(f"{tags[i % 2]} pick {m}" for i, m in enumerate(maps))
+    note = f"{tags[0]} ban {MAPS[-1]}; {tags[1]} ban {MAPS[-2]}; {picks}"
+    if spec.n_maps > 1:
+        note += f"; {MAPS[0]} remains"
+
+    match_html = f"""<!DOCTYPE html>
+<html><head><title>{teams[0].name} vs. {teams[1].name} | Test Event 2025 | VLR.gg</title></head>
+<body><div class="header">{_filler(rng, 5)}</div>
+<div class="col mod-3"><div class="wf-card match-header">
+<div class="match-header-super"><a class="match-header-event" href="/event/1/test-event-2025"><div><div>Test Event 2025</div>
+<div class="match-header-event-series">Playoffs:
+\t\t\t\tUpper Final</div></div></a>
+<div class="moment-tz-convert" data-utc-ts="{spec.date}"></div>{patch}</div>
+<div class="match-header-vs">
+<a class="match-header-link wf-link-hover mod-1" href="/{teams[0].path}"><div class="wf-title-med">{teams[0].name}</div></a>
+<div class="match-header-vs-score"><div class="match-header-vs-note">final</div>
+<div class="js-spoiler">{map_wins[0]}:{map_wins[1]}</div><div class="match-header-vs-note">Bo{spec.n_maps}</div></div>
+<a class="match-header-link wf-link-hover mod-2" href="/{teams[1].path}"><div class="wf-title-med">{teams[1].name}</div></a>
+</div><div class="match-header-note">{note}</div></div>
+<div class="vm-stats"><div class="vm-stats-gamesnav">{nav if spec.n_maps > 1 else ""}</div>
+<div class="vm-stats-container">{games}</div></div>
+{_filler(rng, filler)}</div></body></html>"""
+    economy_html = (
+        f"<!DOCTYPE html><html><body>{_filler(rng, 5)}"
+        f'<div class="vm-stats-container">{economies}</div>'
+        f"{_filler(rng, filler)}</body></html>"
+    )
+    return match_html, economy_html
+
+
+def team_page(team: Team) -> str:
+    """The team's match list without a core selected, which only matters for
+    the core dropdown: every roster ("All" first, then newest first)."""
+    cores = "".join(
+        f'<a href="/{team.matches_path}/?core_id={core_id}">Core {core_id}</a>'
+        for core_id in range(team.core_id, 0, -1)
+    )
+    return (
+        f'<!DOCTYPE html><html><body><h1 class="wf-title">{team.name}</h1>'
+        f'<span class="wf-dropdown"><a href="/{team.matches_path}/?core_id=">All</a>{cores}</span>'
+        "</body></html>"
+    )
+
+
+def team_matches_page(
+    team: Team, match_paths: list[str], page: int = 1, n_pages: int = 1
+) -> str:
+    cards = "".join(
+        f'<a class="wf-card fc-flex m-item" href="/{path}"><div class="m-item-team">'
+        f"{team.tag}</div></a>"
+        for path in match_paths
+    )
+    pages = "".join(
+        f'<span class="btn mod-page{" mod-active" if p == page else ""}">{p}</span>'
+        if p == page
+        else f'<a class="btn mod-page" href="/{team.matches_path}/?page={p}">{p}</a>'
+        for p in range(1, n_pages + 1)
+    )
+    return (
+        f'<!DOCTYPE html><html><body><h1 class="wf-title">{team.name}</h1>'
+        f'<h2 class="wf-title team-header-tag">{team.tag}</h2>'
+        f'<div class="mod-dark">{cards}</div><div class="action-container">{pages}</div>'
+        "</body></html>"
+    )
+
+
+def home_page(upcoming: list[MatchSpec], played: list[MatchSpec] = ()) -> str:
+    def card(spec: MatchSpec, score: bool) -> str:
+        teams = "".join(
+            f'<div class="h-match-team"><div class="h-match-team-name">{team.name}</div>'
+            + (
+                '<div class="h-match-team-score mod-count js-spoiler">1</div>'
+                if score
+                else ""
+            )
+            + "</div>"
+            for team in spec.teams
+        )
+        return f'<a class="wf-module-item mod-match" href="/{spec.path}">{teams}</a>'
+
+    cards = "".join(card(spec, False) for spec in upcoming)
+    cards += "".join(card(spec, True) for spec in played)
+    return f'<!DOCTYPE html><html><body><div class="js-home-matches-upcoming">{cards}</div></body></html>'
+
+
+def build_site(
+    n_matches: int = 100,
+    page_size: int = 50,
+    seed: int = 0,
+    filler: int = 150,
+) -> Site:
+    """Two teams that each played `n_matches` matches, half of them against
+    each other, and an upcoming match between them on the home page."""
+    rng = random.Random(seed)
+    alpha = Team(1001, "Alpha Team", "ALP", core_id=3)
+    beta = Team(1002, "Beta Squad", "BET", core_id=2)
+    opponents = [Team(2000 + i, f"Opponent {i}", f"OP{i}") for i in range(8)]
+    site = Site(teams=[alpha, beta, *opponents])
+
+    history: dict[int, list[MatchSpec]] = {alpha.team_id: [], beta.team_id: []}
+    match_id = 500_000
+    for i in range(n_matches):
+        for team in (alpha, beta):
+            if len(history[team.team_id]) >= n_matches:
+                continue
+            if team is alpha and i % 2 == 0:
+                teams = (alpha, beta)
+            else:
+                teams = (team, rng.choice(opponents))
+            n_maps = rng.choice([1, 3, 3, 3, 5])
+            spec = MatchSpec(
+                match_id=match_id,
+                teams=teams,
+                n_maps=n_maps,
+                overtime_rounds=rng.choice([0] * 9 + [2, 4]),
+                patch="" if rng.random() < 0.05 else f"9.{rng.randint(0, 12):02d}",
+                seed=match_id,
+                date=f"2025-{1 + i % 12:02d}-{1 + i % 28:02d} 12:00:00",
+            )
+            match_id += 1
+            site.matches.append(spec)
+            for side in teams:
+                if side.team_id in history:
+                    history[side.team_id].append(spec)
+
+    for spec in site.matches:
+        match_html, economy_html = match_pages(spec, filler)
+        site.pages[spec.path] = match_html
+        site.pages[spec.path + ECONOMY] = economy_html
+
+    for team in (alpha, beta):
+        # newest first, as vlr.gg lists them
+        paths = [spec.path for spec in reversed(history[team.team_id])]
+        chunks = [paths[i : i + page_size] for i in range(0, len(paths), page_size)]
+        site.pages[team.matches_path] = team_page(team)
+        for core_id in range(1, team.core_id + 1):
+            base = f"{team.matches_path}/?core_id={core_id}"
+            for page, chunk in enumerate(chunks, start=1):
+                html = team_matches_page(team, chunk, page, len(chunks))
+                if page == 1:
+                    site.pages[base] = html
+                site.pages[f"{base}&page={page}"] = html
+
+    upcoming = MatchSpec(match_id=match_id, teams=(alpha, beta), seed=match_id)
+    upcoming_html, _ = match_pages(upcoming, filler)
+    site.pages[upcoming.path] = upcoming_html.replace(
+        '<div class="match-header-vs-note">final</div>',
+        '<div class="match-header-vs-note">upcoming</div>',
+    )
+    site.pages[""] = home_page([upcoming], site.matches[-3:])
+    return site
+
+
+# checked-in cases: name -> match spec
+CASES = {
+    "bo1": dict(n_maps=1),
+    "bo3": dict(n_maps=3),
+    "bo5": dict(n_maps=5),
+    "overtime": dict(n_maps=3, overtime_rounds=6),
+    "no_patch": dict(n_maps=3, patch=""),
+}
+
+
+def write_corpus(directory: Path = FIXTURES_DIR) -> dict[str, dict]:
+    """Writes the fixture pages plus a manifest mapping each page's url
+    (relative to the site root) to its file and kind."""
+    directory.mkdir(parents=True, exist_ok=True)
+    alpha = Team(1001, "Alpha Team", "ALP", core_id=3)
+    beta = Team(1002, "Beta Squad", "BET", core_id=2)
+    manifest = {}
+
+    def add(name: str, path: str, kind: str, html: str, **extra):
+        (directory / name).write_text(html, encoding="utf-8")
+        manifest[path] = {"file": name, "kind": kind, **extra}
+
+    specs = []
+    for i, (case, options) in enumerate(CASES.items()):
+        spec = MatchSpec(match_id=400_001 + i, teams=(alpha, beta), seed=i, **options)
+        specs.append(spec)
+        match_html, economy_html = match_pages(spec)
+        add(f"match_{case}.html", spec.path, "match", match_html, case=case)
+        add(f"economy_{case}.html", spec.path + ECONOMY, "economy", economy_html, case=case)
+
+    paths = [spec.path for spec in specs]
+    add("team.html", alpha.matches_path, "team", team_page(alpha))
+    for page, chunk in enumerate([paths[:3], paths[3:]], start=1):
+        add(
+            f"team_matches_{page}.html",
+            f"{alpha.matches_path}/?core_id={alpha.core_id}&page={page}",
+            "team_matches",
+            team_matches_page(alpha, chunk, page, 2),
+        )
+    add("home.html", "", "home", home_page(specs[:2], specs[2:]))
+
+    (directory / MANIFEST).write_text(
+        json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+    return manifest
+
+
+def load_corpus(directory: Path = FIXTURES_DIR) -> dict[str, dict]:
+    """The manifest with every entry's page read into `html`."""
+    manifest = json.loads((directory / MANIFEST).read_text(encoding="utf-8"))
+    for entry in manifest.values():
+        entry["html"] = (directory / entry["file"]).read_text(encoding="utf-8")
+    return manifest
+
+
+if __name__ == "__main__":
+    for path, entry in write_corpus().items():
+        print(f"{entry['file']:<24} /{path}")
@@ -0,0 +1,104 @@
+"""Cold import time of the library and the app, from `python -X importtime`.
+
+Each case runs in a fresh interpreter; its time is the sum of every
+module's own import time, best of `--repeat` runs, followed by the top-level
+packages that took the longest. "first page" is everything `app.py`
+imports before it can render the home page, "analysis pages" what opening
+one of them adds on top.
+
+    python -m benchmarks.import_time [--repeat N] [--top N] [--save FILE] [--compare FILE]
+
+`--save` and `--compare` work like in `benchmarks.parser`.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CASES = {
+    "scraper": "import src.scraper",
+    "visualizer": "import src.visualizer",
+    "first page": "import streamlit, src.pages",
+    "analysis pages": (
+        "import streamlit, src.pages\n"
+        "import plotly.subplots, plotly.graph_objects\n"
+        "from src.visualizer import Visualizer\n"
+        "for name in dir(Visualizer):\n"
+        "    getattr(Visualizer, name)"
+    ),
+}
+
+
+def import_times(code: str) -> Counter[str]:
+    """Microseconds spent importing each top-level package."""
+    run = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if run.returncode != 0:
+        raise RuntimeError(run.stderr.strip().splitlines()[-1])
+
+    packages: Counter[str] = Counter()
+    for line in run.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, _, name = line.removeprefix("import time:").split("|")
+        if own.strip().isdigit():
+            packages[name.strip().split(".")[0]] += int(own)
+    return packages
+
+
+def measure(code: str, repeat: int) -> Counter[str]:
+    return min((import_times(code) for _ in range(repeat)), key=lambda p: p.total())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="packages listed per case")
+    parser.add_argument("--save", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else {}
+
+    results, regressions = {}, []
+    print(f"{'case':<16} {'ms':>8} {'vs baseline':>12}  slowest packages")
+    for name, code in CASES.items():
+        try:
+            packages = measure(code, args.repeat)
+        except RuntimeError as e:
+            print(f"{name:<16} {'failed':>8} {'':>12}  {e}")
+            continue
+        ms = packages.total() / 1000
+        results[name] = {"ms": ms}
+
+        change = ""
+        if name in baseline:
+            ratio = ms / baseline[name]["ms"]
+            change = f"{ratio - 1:+.0%}"
+            if ratio > 1 + args.tolerance:
+                regressions.append(name)
+                change += " !"
+        slowest = ", ".join(
+            f"{package} {us / 1000:.0f}" for package, us in packages.most_common(args.top)
+        )
+        print(f"{name:<16} {ms:>8.0f} {change:>12}  {slowest}")
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+    if regressions:
+        print(f"slower than baseline: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
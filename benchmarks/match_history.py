@@ -0,0 +1,153 @@
+"""Cost of building `MatchHistory.overview` and `MatchHistory.round_result`
+for histories of 10, 100 and 1000 matches.
+
+"before" is the plain `pd.concat` over the per-game frames the properties
+used to do, "after" is the current property. Games are synthetic frames with
+the scraper's schemas, so no network or HTML is involved.
+
+    python -m benchmarks.match_history [--repeat N]
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.models import Game, Games, Match, Matches, MatchHistory
+from src.utils import (
+    economy_schema,
+    overview_index,
+    overview_schema,
+    round_result_schema,
+    stat_schema,
+    typed_frame,
+)
+
+SIZES = [10, 100, 1000]
+MAPS = ["Ascent", "Bind", "Haven", "Lotus", "Split"]
+TEAMS = ["Alpha Team", "Beta Squad"]
+ABBREVIATIONS = ["ALP", "BET"]
+
+
+def make_overview(rng: np.random.Generator, map_name: str, game_id: int) -> pd.DataFrame:
+    columns = {
+        "game_id": [game_id] * 10,
+        "map": [map_name] * 10,
+        "team": [ABBREVIATIONS[0]] * 5 + [ABBREVIATIONS[1]] * 5,
+        "name": [f"player{i}" for i in range(10)],
+        "agent": ["jett"] * 10,
+    }
+    schema = dict(overview_schema)
+    for side in ["all", "atk", "def"]:
+        for stat, kind in stat_schema.items():
+            columns[f"{stat}_{side}"] = rng.random(10)
+            schema[f"{stat}_{side}"] = kind
+    return typed_frame(columns, schema, 10).set_index(overview_index)
+
+
+def make_round_result(
+    rng: np.random.Generator, map_name: str, game_id: int
+) -> pd.DataFrame:
+    n = int(rng.integers(13, 29))
+    round_num = np.arange(1, n + 1)
+    winning_side = np.where(rng.random(n) < 0.5, "atk", "def")
+    buytypes = np.array(["full-buy", "semi-buy", "semi-eco", "full-eco"])
+    columns = {
+        "game_id": game_id,
+        "map": map_name,
+        "phase": np.where(
+            round_num > 24,
+            np.char.add("overtime_", (round_num - 24).astype(str)),
+            np.where(round_num > 12, "second_half", "first_half"),
+        ),
+        "round_num": round_num,
+        "winning_side": winning_side,
+        "reason": "elim",
+        "current_score": [f"{i}-0" for i in round_num],
+        "atk_team": ABBREVIATIONS[0],
+        "def_team": ABBREVIATIONS[1],
+        "winning_team": np.where(winning_side == "atk", *ABBREVIATIONS),
+        "atk_buytype": buytypes[rng.integers(0, 4, n)],
+        "def_buytype": buytypes[rng.integers(0, 4, n)],
+        "losing_side": np.where(winning_side == "atk", "def", "atk"),
+        "winner_buytype": buytypes[rng.integers(0, 4, n)],
+        "loser_buytype": buytypes[rng.integers(0, 4, n)],
+    }
+    schema = round_result_schema | economy_schema
+    schema |= dict.fromkeys(["losing_side", "winner_buytype", "loser_buytype"], "str")
+    return typed_frame(columns, schema, n).set_index(
+        ["game_id", "map", "phase", "round_num"]
+    )
+
+
+def make_history(n_matches: int, seed: int = 0) -> MatchHistory:
+    rng = np.random.default_rng(seed)
+    matches = []
+    for match_id in range(n_matches):
+        games = []
+        for i in range(int(rng.integers(1, 4))):
+            game_id = match_id * 10 + i
+            map_name = MAPS[int(rng.integers(len(MAPS)))]
+            games.append(
+                Game(
+                    map_name=map_name,
+                    game_id=game_id,
+                    winner=TEAMS[i % 2],
+                    round_result=make_round_result(rng, map_name, game_id),
+                    overview=make_overview(rng, map_name, game_id),
+                )
+            )
+        matches.append(
+            Match(
+                match_id=match_id,
+                patch=9.10,
+                teams=TEAMS,
+                event_name="Event",
+                stage_name="Stage",
+                match_date=datetime(2025, 1, 1),
+                match_result={TEAMS[0]: 2, TEAMS[1]: 1},
+                team_abbreviation=dict(zip(TEAMS, ABBREVIATIONS)),
+                winner=TEAMS[0],
+                match_url=f"https://www.vlr.gg/{match_id}/x",
+                pick_ban=pd.DataFrame(),
+                games=Games(games),
+            )
+        )
+    return MatchHistory(TEAMS[0], ABBREVIATIONS[0], Matches(matches))
+
+
+def best_of(repeat: int, func) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'matches':>8} {'frame':>13} {'before ms':>10} {'after ms':>9} {'speedup':>8}")
+    for n in SIZES:
+        history = make_history(n)
+        games = list(history.games)
+        for name in ["overview", "round_result"]:
+            frames = [getattr(game, name) for game in games]
+            before = best_of(args.repeat, lambda: pd.concat(frames))
+            after = best_of(
+                args.repeat,
+                lambda: getattr(
+                    MatchHistory(history.full_name, history.short_name, history.matches),
+                    name,
+                ),
+            )
+            print(f"{n:>8} {name:>13} {before:>10.1f} {after:>9.1f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Per-extractor time and memory over the fixture corpus.
+
+Every extractor is run the way `parse_match_info` runs it (on the already
+parsed map/economy nodes), so the numbers add up to a page parse. Times are
+the best of `--repeat` runs, memory is the tracemalloc peak of one run.
+
+    python -m benchmarks.parser [--repeat N] [--save FILE] [--compare FILE]
+
+`--save` writes the results as json, `--compare` checks them against such a
+file and exits with status 1 when any entry got slower than `--tolerance`.
+"""
+
+import argparse
+import io
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Callable
+
+from selectolax.parser import HTMLParser
+
+from benchmarks.corpus import ECONOMY, load_corpus
+from src.scraper.history import (
+    extract_economy_from_html,
+    extract_overview_from_html,
+    extract_round_result_from_html,
+    parse_match_info,
+    parse_page_numbers,
+    parse_team_history_list,
+)
+from src.scraper.team import parse_latest_core_id, parse_team_links
+from src.scraper.upcoming import parse_upcoming_matches
+
+URL = "https://www.vlr.gg/"
+TEAMS = {"Alpha Team": "ALP", "ALP": "Alpha Team", "Beta Squad": "BET", "BET": "Beta Squad"}
+
+
+def measure(func: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """(best time in ms, peak memory in KiB)"""
+    times = []
+    # the parsers print on missing optional data, which isn't what's measured
+    with redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return min(times) * 1000, peak / 1024
+
+
+def match_cases(corpus: dict[str, dict]) -> dict[str, Callable[[], object]]:
+    cases = {}
+    for path, entry in corpus.items():
+        if entry["kind"] != "match":
+            continue
+        match_text = entry["html"]
+        econ_text = corpus[path + ECONOMY]["html"]
+        match_html = HTMLParser(match_text)
+        econ_html = HTMLParser(econ_text)
+        games = [
+            (
+                div.css_first("div.map span").text(strip=True),
+                int(div.attributes["data-game-id"]),
+                div,
+                econ_html.css_first(
+                    f'div.vm-stats-game[data-game-id="{div.attributes["data-game-id"]}"]'
+                ),
+            )
+            for div in match_html.css("div.vm-stats-game[data-game-id]")
+        ]
+        case = entry["case"]
+
+        def html_parse(match_text=match_text, econ_text=econ_text):
+            HTMLParser(match_text), HTMLParser(econ_text)
+
+        def overview(games=games):
+            for map_name, game_id, div, _ in games:
+                for table in div.css("table.wf-table-inset.mod-overview"):
+                    extract_overview_from_html(table, map_name, game_id)
+
+        def round_result(games=games):
+            for map_name, game_id, div, _ in games:
+                extract_round_result_from_html(div, map_name, game_id)
+
+        def economy(games=games):
+            for map_name, game_id, _, div in games:
+                extract_economy_from_html(div, map_name, game_id)
+
+        def match_info(match_text=match_text, econ_text=econ_text, path=path):
+            parse_match_info(match_text, econ_text, URL + path, TEAMS, URL)
+
+        cases[f"{case}/html_parse"] = html_parse
+        cases[f"{case}/overview"] = overview
+        cases[f"{case}/round_result"] = round_result
+        cases[f"{case}/economy"] = economy
+        cases[f"{case}/parse_match_info"] = match_info
+        cases[f"{case}/team_links"] = lambda text=match_text: parse_team_links(text)
+    return cases
+
+
+def page_cases(corpus: dict[str, dict]) -> dict[str, Callable[[], object]]:
+    cases = {}
+    for entry in corpus.values():
+        text = entry["html"]
+        if entry["kind"] == "team":
+            cases["team/latest_core_id"] = lambda text=text: parse_latest_core_id(text, URL)
+        elif entry["kind"] == "team_matches":
+            name = entry["file"].removesuffix(".html")
+
+            def team_matches(text=text):
+                parse_team_history_list(text, URL), parse_page_numbers(text)
+
+            cases[f"{name}/history_list"] = team_matches
+        elif entry["kind"] == "home":
+            cases["home/upcoming"] = lambda text=text: parse_upcoming_matches(text, URL)
+    return cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--save", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    cases = match_cases(corpus) | page_cases(corpus)
+    baseline = json.loads(args.compare.read_text()) if args.compare else {}
+
+    results, regressions = {}, []
+    print(f"{'case':<32} {'ms':>8} {'peak KiB':>9} {'vs baseline':>12}")
+    for name, func in cases.items():
+        ms, peak = measure(func, args.repeat)
+        results[name] = {"ms": ms, "peak_kib": peak}
+
+        change = ""
+        if name in baseline:
+            ratio = ms / baseline[name]["ms"]
+            change = f"{ratio - 1:+.0%}"
+            if ratio > 1 + args.tolerance:
+                regressions.append(name)
+                change += " !"
+        print(f"{name:<32} {ms:>8.2f} {peak:>9.0f} {change:>12}")
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+    if regressions:
+        print(f"slower than baseline: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Local stand-in for vlr.gg that serves pages from memory.
+
+Every response can be delayed (`latency` seconds plus up to `jitter` either
+way) and replaced by a 429 or 500 with the given probabilities, so retries,
+throttling and concurrency settings can be tried without touching the real
+site. Point the scrapers at it through their `url` parameter:
+
+    with ReplayServer(build_site(200).pages, latency=0.05) as server:
+        Scraper.get_team_history(session, match_url, url=server.url)
+
+or run it on its own:
+
+    python -m benchmarks.replay_server [--fixtures | --matches N] [--port P]
+"""
+
+import argparse
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urlsplit
+
+from benchmarks.corpus import build_site, load_corpus
+
+
+class ReplayServer:
+    def __init__(
+        self,
+        pages: dict[str, str],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_429: float = 0.0,
+        rate_500: float = 0.0,
+        retry_after: Optional[float] = 1.0,
+        seed: Optional[int] = None,
+    ):
+        # keys are paths relative to the root with the query, see corpus.Site
+        self.pages = {key.lstrip("/"): html.encode() for key, html in pages.items()}
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_429 = rate_429
+        self.rate_500 = rate_500
+        self.retry_after = retry_after
+        self.statuses: Counter[int] = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def requests(self) -> int:
+        with self._lock:
+            return sum(self.statuses.values())
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.statuses.clear()
+
+    def respond(self, target: str) -> tuple[int, dict[str, str], bytes]:
+        """Status, headers and body for a request target (path and query)."""
+        parts = urlsplit(target)
+        # the scrapers join the root url with absolute hrefs, which doubles
+        # the slash, so paths are matched with repeated slashes collapsed
+        key = re.sub("/{2,}", "/", parts.path).lstrip("/")
+        if parts.query:
+            key += "?" + parts.query
+
+        with self._lock:
+            delay = max(0.0, self.latency + self._random.uniform(-1, 1) * self.jitter)
+            roll = self._random.random()
+
+        time.sleep(delay)
+        if roll < self.rate_429:
+            status, headers, body = 429, {}, b"Too Many Requests"
+            if self.retry_after is not None:
+                headers["Retry-After"] = f"{self.retry_after:g}"
+        elif roll < self.rate_429 + self.rate_500:
+            status, headers, body = 500, {}, b"Internal Server Error"
+        elif key in self.pages:
+            status, headers, body = 200, {}, self.pages[key]
+            headers["Content-Type"] = "text/html; charset=utf-8"
+        else:
+            status, headers, body = 404, {}, b"Not Found"
+
+        with self._lock:
+            self.statuses[status] += 1
+        return status, headers, body
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive, like the real site
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                status, headers, body = server.respond(self.path)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def serve_forever(self) -> None:
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="replay-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--fixtures", action="store_true", help="serve benchmarks/fixtures")
+    source.add_argument("--matches", type=int, default=100, help="matches per team of the generated site")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-500", type=float, default=0.0)
+    args = parser.parse_args()
+
+    if args.fixtures:
+        pages = {path: entry["html"] for path, entry in load_corpus().items()}
+    else:
+        pages = build_site(args.matches).pages
+
+    server = ReplayServer(
+        pages,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_429=args.rate_429,
+        rate_500=args.rate_500,
+    )
+    print(f"serving {len(pages)} pages on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(dict(server.statuses))
+
+
+if __name__ == "__main__":
+    main()
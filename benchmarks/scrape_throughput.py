@@ -0,0 +1,148 @@
+"""End to end `Scraper.get_team_history` throughput against the replay server.
+
+For every worker count, both teams' last `--head` matches are scraped from a
+generated site served with the given latency, jitter and error rates, and
+the run reports matches per second, the p50/p99 latency of a match's
+download (both pages, including throttling and retries) and how many
+requests reached the server.
+
+    python -m benchmarks.scrape_throughput [--workers 1 2 4 8] [--head 50]
+        [--latency 0.05] [--jitter 0.02] [--rate-429 0] [--rate-500 0]
+"""
+
+import argparse
+import io
+import re
+import threading
+import time
+from contextlib import redirect_stdout
+from typing import Optional
+
+import numpy as np
+import requests
+
+from benchmarks.corpus import build_site
+from benchmarks.replay_server import ReplayServer
+from src.scraper import RetryPolicy, Scraper, TokenBucket
+from src.scraper.session import SessionWrapper
+from src.scraper.upcoming import parse_upcoming_matches
+
+
+class TimingSession(SessionWrapper):
+    """Records when each match's page downloads start and end."""
+
+    def __init__(self, session: requests.Session):
+        super().__init__(session)
+        self._lock = threading.Lock()
+        self.spans: dict[str, list[float]] = {}
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        match = re.search(r"/(\d+)/[^/?]+", url)
+        start = time.perf_counter()
+        try:
+            return self._session.get(url, **kwargs)
+        finally:
+            if match and "/team/" not in url:
+                end = time.perf_counter()
+                with self._lock:
+                    span = self.spans.setdefault(match.group(1), [start, end])
+                    span[0], span[1] = min(span[0], start), max(span[1], end)
+
+    def latencies(self) -> np.ndarray:
+        return np.array([end - start for start, end in self.spans.values()])
+
+
+def run(
+    server: ReplayServer,
+    match_url: str,
+    workers: int,
+    head: int,
+    rate: float,
+    retry: RetryPolicy,
+    max_per_host: Optional[int],
+) -> dict[str, float]:
+    session = Scraper.create_session(
+        pool_size=2 * workers + 2,
+        limiter=TokenBucket(rate, burst=max(1, int(rate))),
+        retry=retry,
+    )
+    timing = TimingSession(session)
+    server.reset_stats()
+
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        team1, team2 = Scraper.get_team_history(
+            timing,
+            match_url,
+            head=head,
+            url=server.url,
+            workers=workers,
+            max_per_host=max_per_host,
+        )
+    elapsed = time.perf_counter() - start
+
+    latencies = timing.latencies()
+    matches = len(team1) + len(team2)
+    return {
+        "matches": matches,
+        "seconds": elapsed,
+        "matches_per_s": matches / elapsed,
+        "p50_ms": np.percentile(latencies, 50) * 1000 if len(latencies) else 0.0,
+        "p99_ms": np.percentile(latencies, 99) * 1000 if len(latencies) else 0.0,
+        "requests": server.requests,
+        "errors": server.statuses[429] + server.statuses[500],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--head", type=int, default=50, help="matches per team")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-500", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument(
+        "--rate", type=float, default=1000.0, help="client side requests per second"
+    )
+    parser.add_argument("--max-per-host", type=int)
+    parser.add_argument("--filler", type=int, default=150, help="page padding, see corpus")
+    args = parser.parse_args()
+
+    site = build_site(args.head, filler=args.filler)
+    retry = RetryPolicy(backoff=0.05, max_backoff=1.0)
+    server = ReplayServer(
+        site.pages,
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_429=args.rate_429,
+        rate_500=args.rate_500,
+        retry_after=args.retry_after,
+        seed=0,
+    )
+    with server:
+        match_url = parse_upcoming_matches(site.pages[""], server.url)[0]["link"]
+        print(
+            f"{'workers':>7} {'matches':>7} {'seconds':>8} {'matches/s':>9} "
+            f"{'p50 ms':>8} {'p99 ms':>8} {'requests':>8} {'errors':>6}"
+        )
+        for workers in args.workers:
+            result = run(
+                server,
+                match_url,
+                workers,
+                args.head,
+                args.rate,
+                retry,
+                args.max_per_host,
+            )
+            print(
+                f"{workers:>7} {result['matches']:>7} {result['seconds']:>8.2f} "
+                f"{result['matches_per_s']:>9.1f} {result['p50_ms']:>8.0f} "
+                f"{result['p99_ms']:>8.0f} {result['requests']:>8} {result['errors']:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
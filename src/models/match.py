@@ -1,4 +1,4 @@
-from typing import Iterator
+from typing import Iterator, Optional
 from datetime import datetime
 import pandas as pd
 import numpy as np
@@ -20,6 +20,8 @@ class Match:
         match_url: str,
         pick_ban: pd.DataFrame,
         games: Games,
+        raw_pick_ban: Optional[pd.DataFrame] = None,
+        final: bool = False,
     ) -> None:
         self.match_id = match_id
         self.patch = patch
@@ -32,7 +34,13 @@ class Match:
         self.winner = winner
         self.match_url = match_url
         self.pick_ban = pick_ban
+        # pick/ban rows by the team tag shown on the page, `pick_ban` is the
+        # same rows mapped through `team_abbreviation`
+        self.raw_pick_ban = pick_ban if raw_pick_ban is None else raw_pick_ban
         self.games = games
+        # whether the page showed the match as finished; live or upcoming
+        # matches change and must not be kept by the caches
+        self.final = final
 
         game_data = []
         for game in games:
@@ -67,6 +75,12 @@ class Matches:
     def __getitem__(self, match_id: int) -> Match:
         return self.by_id[match_id]
 
+    def append(self, match: Match) -> None:
+        if match.match_id in self.by_id:
+            return
+        self.matches.append(match)
+        self.by_id[match.match_id] = match
+
     def __len__(self) -> int:
         return len(self.matches)
 
@@ -1,9 +1,10 @@
 import pandas as pd
 from .match import Match, Matches
 from .game import Games
-from typing import Iterator
+from typing import Iterable, Iterator
 import numpy as np
 from functools import cached_property
+from src.utils import concat_frames
 from datetime import datetime
 
 
@@ -73,7 +74,7 @@ class MatchHistory:
         for match in self.matches:
             for game in match.games:
                 all_overview_data.append(game.overview)
-        return pd.concat(all_overview_data)
+        return concat_frames(all_overview_data)
 
     @cached_property
     def round_result(self) -> pd.DataFrame:
@@ -81,7 +82,7 @@ class MatchHistory:
         for match in self.matches:
             for game in match.games:
                 all_round_result.append(game.round_result)
-        return pd.concat(all_round_result)
+        return concat_frames(all_round_result)
 
     @cached_property
     def games(self) -> Games:
@@ -155,6 +156,27 @@ class MatchHistory:
         new_matches_collection = Matches(filtered_matches)
         return MatchHistory(self.full_name, self.short_name, new_matches_collection)
 
+    @classmethod
+    def from_matches(
+        cls, full_name: str, short_name: str, matches: Iterable[Match]
+    ) -> "MatchHistory":
+        return cls(full_name, short_name, Matches(list(matches)))
+
+    def extend(self, matches: Iterable[Match]) -> "MatchHistory":
+        # consumes a match stream (e.g. Scraper.iter_matches) into this
+        # history, dropping the derived frames so they get rebuilt
+        for match in matches:
+            self.matches.append(match)
+        for name in (
+            "matches_data",
+            "games_data",
+            "overview",
+            "round_result",
+            "games",
+        ):
+            self.__dict__.pop(name, None)
+        return self
+
     def __repr__(self) -> str:
         return f"{self.full_name}'s History"
 
@@ -0,0 +1,22 @@
+import streamlit as st
+from typing import Any, Optional
+from src.scraper import Cache, MemoryCache
+
+
+@st.cache_resource
+def _entries() -> MemoryCache:
+    return MemoryCache()
+
+
+class StreamlitCache(Cache):
+    """Scraper cache backend kept in a `st.cache_resource`, so entries are
+    shared by every user of the app and dropped by Streamlit's "Clear cache"."""
+
+    def get(self, key: str) -> Any:
+        return _entries().get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        _entries().set(key, value, ttl)
+
+    def clear(self) -> None:
+        _entries().clear()
@@ -1,9 +1,11 @@
 import streamlit as st
-from src.scraper import Scraper
-import requests
+from src.scraper import Scraper, HistoryStore, HttpCache, MatchCache, TeamRegistry
+from src.pages.cache import StreamlitCache
 import time
 import re
 
+Scraper.get_upcoming_matches.cache = StreamlitCache()
+
 
 def validate_vlr_link(link):
     """
@@ -48,15 +50,23 @@ def extract_teams_from_link(link):
     return None, None
 
 
+@st.cache_resource
+def get_session():
+    return Scraper.create_session(pool_size=16, cache=HttpCache())
+
+
+@st.cache_resource
+def get_team_registry():
+    # one per process, so concurrent users looking up a team share a request
+    return TeamRegistry()
+
+
 def home_page():
     url = "https://www.vlr.gg/"
     st.title("Upcoming VLR Matches")
 
-    # Initialize session
-    session = requests.Session()
-    session.headers.update(
-        {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-    )
+    # Shared across reruns and users so connections stay alive
+    session = get_session()
 
     # Initialize session state variables if they don't exist
     if "team_histories" not in st.session_state:
@@ -192,7 +202,13 @@ def process_match_data(
         match_limit: Number of historical matches to scrape (default: 10)
     """
     team1_history, team2_history = Scraper.get_team_history(
-        session, selected_link, head=match_limit
+        session,
+        selected_link,
+        head=match_limit,
+        workers=4,
+        match_cache=MatchCache(),
+        history_store=HistoryStore(),
+        team_registry=get_team_registry(),
     )
 
     st.session_state.team_histories = {
@@ -1,10 +1,12 @@
 import streamlit as st
 from src.visualizer import Visualizer
-from plotly.subplots import make_subplots
-import plotly.graph_objects as go
 
 
 def map_page():
+    # plotly is only loaded once an analysis page is shown
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     team_1_name = st.session_state.team_histories["team1"]["name"]
     team_2_name = st.session_state.team_histories["team2"]["name"]
     team_1_history = st.session_state.team_histories["team1"]["history"]
@@ -1,9 +1,10 @@
 import streamlit as st
 from src.visualizer import Visualizer
-from plotly.subplots import make_subplots
 
 
 def overview_page():
+    from plotly.subplots import make_subplots
+
     team_1_name = st.session_state.team_histories["team1"]["name"]
     team_2_name = st.session_state.team_histories["team2"]["name"]
     team_1_history = st.session_state.team_histories["team1"]["history"]
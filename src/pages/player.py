@@ -1,10 +1,11 @@
 import streamlit as st
-from plotly.subplots import make_subplots
 from src.visualizer import Visualizer
 from src.utils import stat_cols_full
 
 
 def player_page():
+    from plotly.subplots import make_subplots
+
     team_1_name = st.session_state.team_histories["team1"]["name"]
     team_2_name = st.session_state.team_histories["team2"]["name"]
     team_1_history = st.session_state.team_histories["team1"]["history"]
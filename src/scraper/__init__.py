@@ -1,20 +1,49 @@
 from src.scraper.history import (
     get_team_history_list,
+    get_team_history_pages,
+    history_max_pages,
+    iter_matches,
     scrape_matches,
     scrape_match_info,
+    sync_team_history,
     extract_overview_from_html,
     extract_round_result_from_html,
     extract_economy_from_html,
 )
 from src.scraper.team import get_teams_from_match
+from src.scraper.pipeline import iter_matches_pipelined, scrape_matches_pipelined
 from src.scraper.upcoming import get_upcoming_matches
+from src.scraper.concurrency import SingleFlight, limit_per_host
+from src.scraper.aio import AsyncScraper
+from src.scraper.archive import (
+    ArchivingSession,
+    PageArchive,
+    ReplaySession,
+    backfill_match_cache,
+)
+from src.scraper.cache import Cache, DiskCache, MemoryCache, cached
+from src.scraper.http_cache import CachedSession, HttpCache
+from src.scraper.match_cache import HistoryStore, MatchCache
+from src.scraper.team_registry import TeamInfo, TeamRegistry
+from src.scraper.throttle import RetryPolicy, ThrottledSession, TokenBucket
+from src.scraper.factory import create_session
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 import requests
 
 
 class Scraper:
+    create_session = staticmethod(create_session)
+    backfill_match_cache = staticmethod(backfill_match_cache)
     get_upcoming_matches = staticmethod(get_upcoming_matches)
     get_teams_from_match = staticmethod(get_teams_from_match)
     get_team_history_list = staticmethod(get_team_history_list)
+    get_team_history_pages = staticmethod(get_team_history_pages)
+    sync_team_history = staticmethod(sync_team_history)
+    iter_matches = staticmethod(iter_matches)
+    scrape_matches = staticmethod(scrape_matches)
+    iter_matches_pipelined = staticmethod(iter_matches_pipelined)
+    scrape_matches_pipelined = staticmethod(scrape_matches_pipelined)
     scrape_match_info = staticmethod(scrape_match_info)
     extract_economy_from_html = staticmethod(extract_economy_from_html)
     extract_round_result_from_html = staticmethod(extract_round_result_from_html)
@@ -26,26 +55,73 @@ class Scraper:
         match_url: str,
         head: int = -1,
         url: str = "https://www.vlr.gg/",
+        workers: int = 1,
+        max_per_host: Optional[int] = None,
+        match_cache: Optional[MatchCache] = None,
+        history_store: Optional[HistoryStore] = None,
+        team_registry: Optional[TeamRegistry] = None,
+        all_pages: bool = False,
     ):
-        team1, team2 = get_teams_from_match(_session, match_url)
-        team1_hist_list, team1_abbr = get_team_history_list(_session, team1)
-        team2_hist_list, team2_abbr = get_team_history_list(_session, team2)
-
-        team_abbr = team1_abbr | team2_abbr
-
-        team1_hist = scrape_matches(
-            _session,
-            matches_url=team1_hist_list,
-            head=head,
-            team_abbreviate=team_abbr,
-            full_name=list(team1_abbr.keys())[0],
-        )
-        team2_hist = scrape_matches(
-            _session,
-            matches_url=team2_hist_list,
-            head=head,
-            team_abbreviate=team_abbr,
-            full_name=list(team2_abbr.keys())[0],
-        )
+        """The last `head` matches of both teams of `match_url`. A positive
+        `head` follows the teams' match list pages until it has enough;
+        `head=-1` takes each team's first list page only, or with `all_pages`
+        its whole history (two requests per match)."""
+        if workers > 1:
+            _session = limit_per_host(_session, max_per_host)
+
+        team1, team2 = get_teams_from_match(_session, match_url, url, team_registry)
+
+        # both teams are independent from here on, so each gets its own branch
+        # while the match scrapes of both share one pool of `workers`
+        with ThreadPoolExecutor(max_workers=2) as branches:
+            (team1_hist_list, team1_abbr), (team2_hist_list, team2_abbr) = (
+                branches.map(
+                    lambda team_url: get_team_history_pages(
+                        _session, team_url, url, history_max_pages(head, all_pages)
+                    ),
+                    [team1, team2],
+                )
+            )
+
+            team_abbr = team1_abbr | team2_abbr
+            # head-to-head and shared-opponent matches show up in both lists,
+            # the registry makes sure each is scraped once and shared
+            registry = SingleFlight()
+
+            with ThreadPoolExecutor(max_workers=workers) as match_pool:
+                team1_future = branches.submit(
+                    scrape_matches,
+                    _session,
+                    matches_url=team1_hist_list,
+                    head=head,
+                    team_abbreviate=team_abbr,
+                    full_name=list(team1_abbr.keys())[0],
+                    url=url,
+                    workers=workers,
+                    executor=match_pool,
+                    match_cache=match_cache,
+                    registry=registry,
+                    known=history_store.get(team1) if history_store else None,
+                )
+                team2_future = branches.submit(
+                    scrape_matches,
+                    _session,
+                    matches_url=team2_hist_list,
+                    head=head,
+                    team_abbreviate=team_abbr,
+                    full_name=list(team2_abbr.keys())[0],
+                    url=url,
+                    workers=workers,
+                    executor=match_pool,
+                    match_cache=match_cache,
+                    registry=registry,
+                    known=history_store.get(team2) if history_store else None,
+                )
+                team1_hist = team1_future.result()
+                team2_hist = team2_future.result()
+
+        if history_store is not None:
+            history_store.put(team1, team1_hist)
+            history_store.put(team2, team2_hist)
 
         return team1_hist, team2_hist
@@ -0,0 +1,293 @@
+import asyncio
+import httpx
+from typing import AsyncIterator, Iterable, Optional, Union
+from src.models import Match, Matches, MatchHistory
+from src.scraper.concurrency import async_ordered_map
+from src.scraper.history import (
+    history_max_pages,
+    parse_match_info,
+    parse_page_numbers,
+    parse_team_history_list,
+    with_page,
+)
+from src.scraper.throttle import (
+    RetryPolicy,
+    TokenBucket,
+    default_limiter,
+    default_retry,
+)
+from src.scraper.team import parse_latest_core_id, parse_team_links, team_matches_url
+from src.scraper.upcoming import parse_upcoming_matches
+
+
+class ThrottledTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of `ThrottledSession`, applied at the transport
+    level so every request made through the client is rate limited and
+    retried."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        limiter: Optional[TokenBucket] = None,
+        retry: Optional[RetryPolicy] = None,
+    ):
+        self._transport = transport
+        self.limiter = limiter or default_limiter
+        self.retry = retry or default_retry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(self.retry.attempts):
+            last_attempt = attempt == self.retry.attempts - 1
+            await self.limiter.acquire_async()
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+                await asyncio.sleep(self.retry.delay(attempt))
+                continue
+
+            if response.status_code not in self.retry.statuses or last_attempt:
+                return response
+
+            delay = self.retry.delay(attempt, response.headers.get("Retry-After"))
+            await response.aclose()
+            if response.status_code == 429:
+                self.limiter.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def create_client(
+    max_connections: int = 20,
+    headers: Optional[dict[str, str]] = None,
+    timeout: float = 30.0,
+    limiter: Optional[TokenBucket] = None,
+    retry: Optional[RetryPolicy] = None,
+) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+    )
+    return httpx.AsyncClient(
+        transport=ThrottledTransport(
+            httpx.AsyncHTTPTransport(limits=limits), limiter=limiter, retry=retry
+        ),
+        headers=headers
+        or {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
+        limits=limits,
+        timeout=timeout,
+        follow_redirects=True,
+    )
+
+
+async def get_upcoming_matches(
+    _client: httpx.AsyncClient, url: str = "https://www.vlr.gg/"
+) -> list[dict[str, str]]:
+    response = await _client.get(url)
+    response.raise_for_status()
+    return parse_upcoming_matches(response.text, url)
+
+
+async def get_teams_from_match(
+    _client: httpx.AsyncClient, match_url: str, url: str = "https://www.vlr.gg/"
+) -> list[str]:
+    match_response = await _client.get(match_url)
+    match_response.raise_for_status()
+    teams = parse_team_links(match_response.text)
+
+    team_responses = await asyncio.gather(
+        *(_client.get(team_matches_url(team, url)) for team in teams)
+    )
+    for response in team_responses:
+        response.raise_for_status()
+    return [parse_latest_core_id(response.text, url) for response in team_responses]
+
+
+async def get_team_history_list(
+    _client: httpx.AsyncClient,
+    team_url: str,
+    url: str = "https://www.vlr.gg/",
+) -> tuple[list[str], dict[str, str]]:
+    team_history_response = await _client.get(team_url)
+    team_history_response.raise_for_status()
+    return parse_team_history_list(team_history_response.text, url)
+
+
+async def get_team_history_pages(
+    _client: httpx.AsyncClient,
+    team_url: str,
+    url: str = "https://www.vlr.gg/",
+    max_pages: Optional[int] = None,
+) -> tuple[AsyncIterator[str], dict[str, str]]:
+    """Async counterpart of `history.get_team_history_pages`, later list pages
+    are requested as the returned iterator reaches them."""
+    team_history_response = await _client.get(team_url)
+    team_history_response.raise_for_status()
+    matches_url, team_abbreviate = parse_team_history_list(
+        team_history_response.text, url
+    )
+    pages = _iter_team_history_pages(
+        _client, team_url, team_history_response.text, matches_url, url, max_pages
+    )
+    return pages, team_abbreviate
+
+
+async def _iter_team_history_pages(
+    _client: httpx.AsyncClient,
+    team_url: str,
+    html: str,
+    matches_url: list[str],
+    url: str,
+    max_pages: Optional[int] = None,
+) -> AsyncIterator[str]:
+    page = 1
+    while matches_url:
+        for match_url in matches_url:
+            yield match_url
+
+        page += 1
+        if max_pages is not None and page > max_pages:
+            return
+        if page not in parse_page_numbers(html):
+            return
+        response = await _client.get(with_page(team_url, page))
+        response.raise_for_status()
+        html = response.text
+        matches_url, _ = parse_team_history_list(html, url)
+
+
+async def _take(urls: AsyncIterator[str], n: Optional[int]) -> list[str]:
+    # up to `n` urls (None: all the rest)
+    taken = []
+    while n is None or len(taken) < n:
+        try:
+            taken.append(await urls.__anext__())
+        except StopAsyncIteration:
+            break
+    return taken
+
+
+async def _as_async_iterator(urls: Iterable[str]) -> AsyncIterator[str]:
+    for match_url in urls:
+        yield match_url
+
+
+async def scrape_match_info(
+    _client: httpx.AsyncClient,
+    match_url: str,
+    team_abbreviate: dict[str, str],
+    url: str = "https://www.vlr.gg/",
+) -> Optional[Match]:
+    try:
+        match_response, econ_response = await asyncio.gather(
+            _client.get(match_url),
+            _client.get(f"{match_url}?game=all&tab=economy"),
+        )
+        match_response.raise_for_status()
+        econ_response.raise_for_status()
+    except httpx.HTTPError as e:
+        print(f"Error fetching page: {e}")
+        return None
+
+    return parse_match_info(
+        match_response.text,
+        econ_response.text,
+        match_url=match_url,
+        team_abbreviate=team_abbreviate,
+        url=url,
+    )
+
+
+async def scrape_matches(
+    _client: httpx.AsyncClient,
+    matches_url: Union[Iterable[str], AsyncIterator[str]],
+    head: int,
+    team_abbreviate: dict[str, str],
+    full_name: str,
+    url: str = "https://www.vlr.gg/",
+    concurrency: int = 10,
+) -> MatchHistory:
+
+    result = []
+
+    if hasattr(matches_url, "__anext__"):
+        remaining = matches_url
+    else:
+        remaining = _as_async_iterator(matches_url)
+    while head == -1 or len(result) < head:
+        # head=-1 scrapes every url given, in one round
+        batch = await _take(remaining, None if head == -1 else head - len(result))
+        if not batch:
+            break
+        async for match in async_ordered_map(
+            lambda match_url: scrape_match_info(
+                _client, match_url, team_abbreviate=team_abbreviate, url=url
+            ),
+            batch,
+            concurrency=concurrency,
+        ):
+            if match is not None:
+                result.append(match)
+
+    matches = Matches(result)
+    return MatchHistory(full_name, team_abbreviate[full_name], matches)
+
+
+async def get_team_history(
+    _client: httpx.AsyncClient,
+    match_url: str,
+    head: int = -1,
+    url: str = "https://www.vlr.gg/",
+    concurrency: int = 10,
+    all_pages: bool = False,
+) -> tuple[MatchHistory, MatchHistory]:
+    """Like `Scraper.get_team_history`, the match lists are followed past their
+    first page until `head` matches are scraped. `head=-1` takes each team's
+    first list page only, or with `all_pages` the team's whole history."""
+    team1, team2 = await get_teams_from_match(_client, match_url, url=url)
+    max_pages = history_max_pages(head, all_pages)
+    (team1_hist_list, team1_abbr), (team2_hist_list, team2_abbr) = await asyncio.gather(
+        get_team_history_pages(_client, team1, url=url, max_pages=max_pages),
+        get_team_history_pages(_client, team2, url=url, max_pages=max_pages),
+    )
+
+    team_abbr = team1_abbr | team2_abbr
+
+    team1_hist, team2_hist = await asyncio.gather(
+        scrape_matches(
+            _client,
+            matches_url=team1_hist_list,
+            head=head,
+            team_abbreviate=team_abbr,
+            full_name=list(team1_abbr.keys())[0],
+            url=url,
+            concurrency=concurrency,
+        ),
+        scrape_matches(
+            _client,
+            matches_url=team2_hist_list,
+            head=head,
+            team_abbreviate=team_abbr,
+            full_name=list(team2_abbr.keys())[0],
+            url=url,
+            concurrency=concurrency,
+        ),
+    )
+
+    return team1_hist, team2_hist
+
+
+class AsyncScraper:
+    create_client = staticmethod(create_client)
+    get_upcoming_matches = staticmethod(get_upcoming_matches)
+    get_teams_from_match = staticmethod(get_teams_from_match)
+    get_team_history_list = staticmethod(get_team_history_list)
+    get_team_history_pages = staticmethod(get_team_history_pages)
+    scrape_match_info = staticmethod(scrape_match_info)
+    scrape_matches = staticmethod(scrape_matches)
+    get_team_history = staticmethod(get_team_history)
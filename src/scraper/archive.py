@@ -0,0 +1,191 @@
+import gzip
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import requests
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, Union
+from src.scraper.history import parse_match_info
+from src.scraper.http_cache import default_cache_dir, is_final_match_page
+from src.scraper.match_cache import MatchCache
+from src.scraper.session import SessionWrapper, make_response
+
+
+class ArchivedPage(NamedTuple):
+    url: str
+    fetched_at: float
+    content_hash: str
+    encoding: Optional[str]
+    content: bytes
+
+
+class PageArchive:
+    """Append-only archive of every page downloaded, in one sqlite file.
+
+    Each download is logged with its url, fetch time and the sha256 of its
+    body; bodies are stored gzipped once per distinct hash, so pages that
+    didn't change between fetches cost nothing but an index row.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path or default_cache_dir() / "archive.sqlite3")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS bodies "
+                "(hash TEXT PRIMARY KEY, body BLOB NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS pages (url TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, hash TEXT NOT NULL, encoding TEXT)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS pages_url ON pages (url, fetched_at)"
+            )
+
+    def add(
+        self,
+        url: str,
+        content: bytes,
+        encoding: Optional[str] = "utf-8",
+        fetched_at: Optional[float] = None,
+    ) -> str:
+        content_hash = hashlib.sha256(content).hexdigest()
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        with self._lock, self._db:
+            known = self._db.execute(
+                "SELECT 1 FROM bodies WHERE hash = ?", (content_hash,)
+            ).fetchone()
+            if known is None:
+                self._db.execute(
+                    "INSERT INTO bodies VALUES (?, ?)",
+                    (content_hash, gzip.compress(content, compresslevel=6)),
+                )
+            self._db.execute(
+                "INSERT INTO pages VALUES (?, ?, ?, ?)",
+                (url, fetched_at, content_hash, encoding),
+            )
+        return content_hash
+
+    def get(self, url: str, before: Optional[float] = None) -> Optional[ArchivedPage]:
+        """The latest copy of `url`, or the latest fetched before `before`."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT pages.fetched_at, pages.hash, pages.encoding, bodies.body "
+                "FROM pages JOIN bodies ON bodies.hash = pages.hash "
+                "WHERE pages.url = ? AND pages.fetched_at < ? "
+                "ORDER BY pages.fetched_at DESC LIMIT 1",
+                (url, float("inf") if before is None else before),
+            ).fetchone()
+        if row is None:
+            return None
+        fetched_at, content_hash, encoding, body = row
+        return ArchivedPage(url, fetched_at, content_hash, encoding, gzip.decompress(body))
+
+    def history(self, url: str) -> list[tuple[float, str]]:
+        """(fetch time, content hash) of every download of `url`, oldest first."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT fetched_at, hash FROM pages WHERE url = ? ORDER BY fetched_at",
+                (url,),
+            ).fetchall()
+
+    def urls(self, pattern: Optional[str] = None) -> Iterator[str]:
+        with self._lock:
+            urls = [
+                url
+                for (url,) in self._db.execute(
+                    "SELECT DISTINCT url FROM pages ORDER BY url"
+                )
+            ]
+        if pattern is None:
+            return iter(urls)
+        regex = re.compile(pattern)
+        return (url for url in urls if regex.search(url))
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM pages WHERE url = ? LIMIT 1", (url,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._db.execute(
+                "SELECT COUNT(DISTINCT url) FROM pages"
+            ).fetchone()
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class ArchivingSession(SessionWrapper):
+    """Appends the body of every 200 response to a `PageArchive`."""
+
+    def __init__(self, session: requests.Session, archive: PageArchive):
+        super().__init__(session)
+        self.archive = archive
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        response = self._session.get(url, **kwargs)
+        if response.status_code == 200 and not kwargs.get("params"):
+            self.archive.add(url, response.content, response.encoding)
+        return response
+
+
+class ReplaySession(SessionWrapper):
+    """Serves `get` from a `PageArchive` without touching the network; urls
+    that were never archived get a 404."""
+
+    offline = True
+
+    def __init__(self, archive: PageArchive, before: Optional[float] = None):
+        super().__init__(requests.Session())
+        self.archive = archive
+        self.before = before
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        page = self.archive.get(url, self.before)
+        if page is None:
+            return make_response(url, b"", 404, reason="Not in archive")
+        return make_response(
+            url, page.content, headers={"Content-Type": "text/html"}, encoding=page.encoding
+        )
+
+
+def backfill_match_cache(
+    archive: PageArchive,
+    match_cache: Optional[MatchCache] = None,
+    url: str = "https://www.vlr.gg/",
+) -> int:
+    """Parses every finished match archived together with its economy tab
+    into `match_cache`, e.g. after a parser change bumped `PARSER_VERSION`.
+    Returns how many matches were cached."""
+    match_cache = match_cache if match_cache is not None else MatchCache()
+
+    def text(page: ArchivedPage) -> str:
+        return page.content.decode(page.encoding or "utf-8", errors="replace")
+
+    cached = 0
+    for match_url in archive.urls("^" + re.escape(url) + r"\d+/[^?]*$"):
+        match_page = archive.get(match_url)
+        econ_page = archive.get(f"{match_url}?game=all&tab=economy")
+        if econ_page is None:
+            continue
+
+        match_text = text(match_page)
+        if not is_final_match_page(match_text):
+            continue
+        match = parse_match_info(match_text, text(econ_page), match_url, None, url)
+        if match is not None:
+            match_cache.put(match)
+            cached += 1
+    return cached
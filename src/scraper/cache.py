@@ -0,0 +1,150 @@
+import functools
+import hashlib
+import inspect
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar, Union
+from src.scraper.concurrency import SingleFlight
+from src.scraper.http_cache import default_cache_dir
+from src.utils import atomic_write
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# returned by `Cache.get` on a miss, so `None` can be cached like any value
+MISSING = object()
+
+
+class Cache(ABC):
+    """Where `cached` functions keep their results. Backends only store and
+    expire values; keys are built by `cached`."""
+
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """The value stored under `key`, or `MISSING`."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class MemoryCache(Cache):
+    """Per process, dropping the least recently used entry past `maxsize`."""
+
+    def __init__(self, maxsize: Optional[int] = 256):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[Optional[float], Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at is not None and time.time() >= expires_at:
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = None if ttl is None else time.time() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCache(Cache):
+    """Pickled values on disk, one file per key, shared by every process
+    pointed at the same directory."""
+
+    def __init__(self, directory: Union[str, Path, None] = None):
+        self.directory = Path(directory or default_cache_dir() / "calls")
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.pkl"
+
+    def get(self, key: str) -> Any:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                expires_at, value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return MISSING
+        if expires_at is not None and time.time() >= expires_at:
+            path.unlink(missing_ok=True)
+            return MISSING
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = None if ttl is None else time.time() + ttl
+        atomic_write(
+            self._path(key),
+            pickle.dumps((expires_at, value), protocol=pickle.HIGHEST_PROTOCOL),
+        )
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.pkl"):
+            path.unlink(missing_ok=True)
+
+
+def _call_key(func: Callable, signature: inspect.Signature, args, kwargs) -> str:
+    # like st.cache_data, parameters starting with "_" (sessions, clients)
+    # aren't part of the key
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    hashed = sorted(
+        (name, value)
+        for name, value in bound.arguments.items()
+        if not name.startswith("_")
+    )
+    return f"{func.__module__}.{func.__qualname__}:{hashed!r}"
+
+
+def cached(ttl: Optional[float] = None, cache: Optional[Cache] = None) -> Callable[[F], F]:
+    """Caches a function's results for `ttl` seconds in `cache`, a
+    `MemoryCache` unless given. The backend can be swapped later through the
+    wrapper's `cache` attribute; concurrent misses of one key share a call."""
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+        flight = SingleFlight(forget=True)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _call_key(func, signature, args, kwargs)
+            value = wrapper.cache.get(key)
+            if value is not MISSING:
+                return value
+
+            def call():
+                value = func(*args, **kwargs)
+                wrapper.cache.set(key, value, wrapper.ttl)
+                return value
+
+            return flight.do(key, call)
+
+        wrapper.cache = cache if cache is not None else MemoryCache()
+        wrapper.ttl = ttl
+        return wrapper
+
+    return decorator
@@ -0,0 +1,183 @@
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+)
+from urllib.parse import urlsplit
+
+import requests
+
+from src.scraper.session import SessionWrapper
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class HostLimitedSession(SessionWrapper):
+    """Wraps a session so that at most `max_per_host` requests to the same
+    host are in flight at once, no matter how many threads share it."""
+
+    def __init__(self, session: requests.Session, max_per_host: int):
+        if max_per_host < 1:
+            raise ValueError("max_per_host must be at least 1")
+        super().__init__(session)
+        self.max_per_host = max_per_host
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+    def _semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._semaphores[host]
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        with self._semaphore(url):
+            return self._session.get(url, **kwargs)
+
+
+def limit_per_host(
+    _session: requests.Session, max_per_host: Optional[int]
+) -> requests.Session:
+    if max_per_host is None or isinstance(_session, HostLimitedSession):
+        return _session
+    return HostLimitedSession(_session, max_per_host)
+
+
+class SingleFlight:
+    """Runs `func` at most once per key. Callers asking for a key that is
+    already being computed wait for that call and get the same result, so
+    concurrent scrapes of one match collapse into a single one.
+
+    With `forget=True` a key is dropped once its call finishes, so only
+    callers that overlap share a result and later ones run `func` again.
+    """
+
+    def __init__(self, forget: bool = False):
+        self.forget = forget
+        self._lock = threading.Lock()
+        self._futures: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, func: Callable[[], R]) -> R:
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = self._futures[key] = Future()
+
+        if owner:
+            try:
+                future.set_result(func())
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                if self.forget:
+                    with self._lock:
+                        del self._futures[key]
+        return future.result()
+
+
+_fetch_pool: Optional[ThreadPoolExecutor] = None
+_fetch_pool_lock = threading.Lock()
+
+
+def _get_fetch_pool() -> ThreadPoolExecutor:
+    global _fetch_pool
+    with _fetch_pool_lock:
+        if _fetch_pool is None:
+            _fetch_pool = ThreadPoolExecutor(
+                max_workers=32, thread_name_prefix="vlr-fetch"
+            )
+        return _fetch_pool
+
+
+def get_concurrently(
+    _session: requests.Session, *urls: str, **kwargs
+) -> list[requests.Response]:
+    """GETs every url at once and returns the responses in the same order.
+    The first url is fetched on the calling thread, the rest on a shared
+    background pool; the first exception raised is propagated."""
+    first, *rest = urls
+    futures = [_get_fetch_pool().submit(_session.get, u, **kwargs) for u in rest]
+    try:
+        responses = [_session.get(first, **kwargs)]
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    return responses + [future.result() for future in futures]
+
+
+def ordered_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    workers: int = 1,
+    executor: Optional[Executor] = None,
+) -> Iterator[R]:
+    """Lazily yields `func(item)` for every item, in input order, keeping at
+    most `workers` calls in flight. Closing the iterator early cancels
+    whatever has not started yet."""
+    if workers <= 1 and executor is None:
+        for item in items:
+            yield func(item)
+        return
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    pending: deque[Future] = deque()
+    items = iter(items)
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= workers:
+                break
+
+        while pending:
+            result = pending.popleft().result()
+            for item in items:
+                pending.append(executor.submit(func, item))
+                break
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def async_ordered_map(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    concurrency: int = 1,
+) -> AsyncIterator[R]:
+    """Async counterpart of `ordered_map`: runs `func` as tasks with at most
+    `concurrency` pending and yields their results in input order."""
+    pending: deque[asyncio.Task] = deque()
+    items = iter(items)
+    try:
+        for item in items:
+            pending.append(asyncio.ensure_future(func(item)))
+            if len(pending) >= concurrency:
+                break
+
+        while pending:
+            result = await pending.popleft()
+            for item in items:
+                pending.append(asyncio.ensure_future(func(item)))
+                break
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,74 @@
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Optional
+from urllib3.util import make_headers
+from src.scraper.archive import ArchivingSession, PageArchive, ReplaySession
+from src.scraper.http_cache import CachedSession, HttpCache
+from src.scraper.throttle import RetryPolicy, ThrottledSession, TokenBucket
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    # advertises gzip/deflate, plus br when the brotli package is installed
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+    "Connection": "keep-alive",
+}
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """Applies `timeout` to every request that doesn't set its own, so a
+    stalled connection raises `requests.Timeout` (and gets retried) instead
+    of hanging its worker."""
+
+    def __init__(self, *args, timeout: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timeout = timeout
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def create_session(
+    pool_size: int = 16,
+    headers: Optional[dict[str, str]] = None,
+    timeout: Optional[float] = 30.0,
+    cache: Optional[HttpCache] = None,
+    limiter: Optional[TokenBucket] = None,
+    retry: Optional[RetryPolicy] = None,
+    archive: Optional[PageArchive] = None,
+    replay: bool = False,
+) -> requests.Session:
+    """Builds the session the scrapers are meant to share: one keep-alive
+    connection pool per host sized for `pool_size` concurrent requests,
+    compressed transfers, rate limiting and retries, and optionally an
+    on-disk HTTP cache in front of all of it.
+
+    `pool_size` should be at least the number of requests the scraper keeps
+    in flight, i.e. twice the `workers` passed to `get_team_history` since
+    every match scrape fetches two pages at once. `timeout` (seconds, like
+    `aio.create_client`) applies to requests that don't pass their own.
+
+    With an `archive` every downloaded page is also appended to it. With
+    `replay=True` nothing is downloaded at all: pages are served from the
+    archive as they were recorded.
+    """
+    if replay:
+        if archive is None:
+            raise ValueError("replay needs an archive to replay from")
+        return ReplaySession(archive)
+
+    session = requests.Session()
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=4, pool_maxsize=pool_size, timeout=timeout
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS | (headers or {}))
+    if archive is not None:
+        session = ArchivingSession(session, archive)
+
+    session = ThrottledSession(session, limiter=limiter, retry=retry)
+    if cache is not None:
+        session = CachedSession(session, cache)
+    return session
@@ -1,10 +1,37 @@
+import sys
 import requests
-from selectolax.parser import HTMLParser
+from selectolax.parser import HTMLParser, Node
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from src.utils import detect_type, vectorized_lookup
+from src.utils import (
+    economy_schema,
+    empty_frame,
+    overview_index,
+    overview_schema,
+    round_result_schema,
+    stat_schema,
+    typed_frame,
+    vectorized_lookup,
+)
 from src.models import Match, Matches, MatchHistory, Game, Games
-from typing import Optional
+from src.scraper.concurrency import (
+    SingleFlight,
+    get_concurrently,
+    limit_per_host,
+    ordered_map,
+)
+from src.scraper.http_cache import is_final_match_page
+from src.scraper.match_cache import MatchCache
+from src.scraper.throttle import throttled
+from typing import Iterable, Iterator, Optional, Union
+from concurrent.futures import Executor
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from itertools import islice
+
+# bump whenever a parser change alters the Match objects it produces, so
+# that MatchCache entries from an older parser are not reused
+PARSER_VERSION = 6
 
 
 def get_team_history_list(
@@ -12,8 +39,84 @@ def get_team_history_list(
     team_url: str,
     url: str = "https://www.vlr.gg/",
 ) -> tuple[list[str], dict[str, str]]:
+    team_history_response = throttled(_session).get(team_url)
+    team_history_response.raise_for_status()
+    return parse_team_history_list(team_history_response.text, url)
+
+
+def get_team_history_pages(
+    _session: requests.Session,
+    team_url: str,
+    url: str = "https://www.vlr.gg/",
+    max_pages: Optional[int] = None,
+) -> tuple[Iterator[str], dict[str, str]]:
+    """Like `get_team_history_list` but follows the match list's pagination,
+    up to `max_pages` pages (None: every page). Only the first page is
+    fetched up front since it carries the team names, later pages are
+    requested as the returned iterator reaches them."""
+    _session = throttled(_session)
     team_history_response = _session.get(team_url)
-    team_history_page = HTMLParser(team_history_response.text)
+    team_history_response.raise_for_status()
+    matches_url, team_abbreviate = parse_team_history_list(
+        team_history_response.text, url
+    )
+    pages = _iter_team_history_pages(
+        _session, team_url, team_history_response.text, matches_url, url, max_pages
+    )
+    return pages, team_abbreviate
+
+
+def _iter_team_history_pages(
+    _session: requests.Session,
+    team_url: str,
+    html: str,
+    matches_url: list[str],
+    url: str,
+    max_pages: Optional[int] = None,
+) -> Iterator[str]:
+    page = 1
+    while matches_url:
+        yield from matches_url
+
+        page += 1
+        if max_pages is not None and page > max_pages:
+            return
+        if page not in parse_page_numbers(html):
+            return
+        response = _session.get(with_page(team_url, page))
+        response.raise_for_status()
+        html = response.text
+        matches_url, _ = parse_team_history_list(html, url)
+
+
+def history_max_pages(head: int, all_pages: bool = False) -> Optional[int]:
+    # head=-1 used to mean "the first list page", walking a team's whole
+    # history costs two requests per match so it has to be asked for
+    if head == -1 and not all_pages:
+        return 1
+    return None
+
+
+def with_page(team_url: str, page: int) -> str:
+    parts = urlsplit(team_url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != "page"]
+    query.append(("page", str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def parse_page_numbers(html: str) -> set[int]:
+    tree = HTMLParser(html)
+    return {
+        int(text)
+        for node in tree.css(".mod-page")
+        if (text := node.text(strip=True)).isdigit()
+    }
+
+
+def parse_team_history_list(
+    html: str, url: str = "https://www.vlr.gg/"
+) -> tuple[list[str], dict[str, str]]:
+    team_history_page = HTMLParser(html)
 
     full_name_node = team_history_page.css_first("h1.wf-title")
     abbr_name_node = team_history_page.css_first("h2.wf-title.team-header-tag")
@@ -36,54 +139,167 @@ def get_team_history_list(
     return result, all_abbr
 
 
-def scrape_matches(
+def match_id_from_url(match_url: str, url: str = "https://www.vlr.gg/") -> int:
+    return int(match_url.removeprefix(url).split("/")[0])
+
+
+def iter_matches(
     _session: requests.Session,
-    matches_url: list[str],
+    matches_url: Iterable[str],
     head: int,
     team_abbreviate: dict[str, str],
-    full_name: str,
     url: str = "https://www.vlr.gg/",
-) -> MatchHistory:
+    workers: int = 1,
+    max_per_host: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    match_cache: Optional[MatchCache] = None,
+    known: Optional[MatchHistory] = None,
+    registry: Optional[SingleFlight] = None,
+) -> Iterator[Match]:
+    """Yields the first `head` matches of `matches_url` that scrape
+    successfully, in list order, each as soon as it is parsed."""
+    if head == -1:
+        head = sys.maxsize
 
-    result = []
+    if workers > 1:
+        _session = limit_per_host(_session, max_per_host)
 
-    if head == -1:
-        head = len(matches_url)
+    # finished matches already present in `known` are reused, bound to this
+    # matchup's abbreviations, only the rest of the list costs a scrape
+    known_matches = final_matches(known)
 
-    idx = 0
-    while len(result) < head or idx == len(matches_url):
-        # print(f"working on {matches_url[idx]}")
-        result.append(
-            scrape_match_info(
+    def scrape(match_url: str) -> Optional[Match]:
+        match_id = match_id_from_url(match_url, url)
+        match = known_matches.get(match_id)
+        if match is not None:
+            return bind_team_abbreviation(match, team_abbreviate)
+
+        def scrape_once() -> Optional[Match]:
+            return scrape_match_info(
                 _session=_session,
-                match_url=matches_url[idx],
+                match_url=match_url,
                 team_abbreviate=team_abbreviate,
+                url=url,
+                match_cache=match_cache,
             )
-        )
-        idx += 1
 
-    matches = Matches(result)
+        if registry is None:
+            return scrape_once()
+        return registry.do(match_id, scrape_once)
+
+    # each round takes exactly as many urls as matches are still missing, so
+    # nothing past `head` gets scraped unless an earlier scrape failed
+    found = 0
+    remaining = iter(matches_url)
+    while found < head:
+        batch = list(islice(remaining, head - found))
+        if not batch:
+            break
+        for match in ordered_map(scrape, batch, workers=workers, executor=executor):
+            if match is not None:
+                found += 1
+                yield match
+
+
+def final_matches(history: Optional[MatchHistory]) -> dict[int, Match]:
+    """The matches of `history` that were finished when scraped, by id. Live
+    ones still change, so they are always scraped again."""
+    if history is None:
+        return {}
+    return {
+        match_id: match
+        for match_id, match in history.matches.by_id.items()
+        if match.final
+    }
+
+
+def scrape_matches(
+    _session: requests.Session,
+    matches_url: Iterable[str],
+    head: int,
+    team_abbreviate: dict[str, str],
+    full_name: str,
+    url: str = "https://www.vlr.gg/",
+    workers: int = 1,
+    max_per_host: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    match_cache: Optional[MatchCache] = None,
+    known: Optional[MatchHistory] = None,
+    registry: Optional[SingleFlight] = None,
+) -> MatchHistory:
+    result = iter_matches(
+        _session,
+        matches_url,
+        head=head,
+        team_abbreviate=team_abbreviate,
+        url=url,
+        workers=workers,
+        max_per_host=max_per_host,
+        executor=executor,
+        match_cache=match_cache,
+        known=known,
+        registry=registry,
+    )
+
+    matches = Matches(list(result))
     match_history = MatchHistory(full_name, team_abbreviate[full_name], matches)
     return match_history
 
 
+def sync_team_history(
+    _session: requests.Session,
+    team_url: str,
+    history: MatchHistory,
+    head: int = -1,
+    url: str = "https://www.vlr.gg/",
+    workers: int = 1,
+    match_cache: Optional[MatchCache] = None,
+    all_pages: bool = False,
+) -> MatchHistory:
+    """Brings a previously scraped `history` up to date: re-reads the team's
+    match list and only scrapes the matches `history` doesn't have yet.
+
+    A positive `head` follows the list's pages until it has enough matches;
+    `head=-1` takes the first page only, or every page with `all_pages`."""
+    matches_url, team_abbreviate = get_team_history_pages(
+        _session, team_url, url, history_max_pages(head, all_pages)
+    )
+    return scrape_matches(
+        _session,
+        matches_url=matches_url,
+        head=head,
+        team_abbreviate=team_abbreviate,
+        full_name=history.full_name,
+        url=url,
+        workers=workers,
+        match_cache=match_cache,
+        known=history,
+    )
+
+
+def as_tree(html: Union[str, Node]) -> Union[HTMLParser, Node]:
+    # extractors take either markup or an already parsed node, so callers
+    # holding a parsed page can hand over subtrees without re-parsing them
+    return HTMLParser(html) if isinstance(html, str) else html
+
+
 def extract_round_result_from_html(
-    html: str, map_name: str, game_id: int
+    html: Union[str, Node], map_name: str, game_id: int
 ) -> pd.DataFrame:
-    tree = HTMLParser(html)
+    tree = as_tree(html)
     game_phase = tree.css("div.vlr-rounds-row")
-    opp_side = {
-        "Attack": "Defense",
-        "Defense": "Attack",
-    }
 
-    phase_side = dict()
-    data = []
+    index_cols = ["game_id", "map", "phase", "round_num"]
+    round_nums, winning_sides, reasons, scores = [], [], [], []
+    # per rounds row (regulation, overtime): whether the team listed on top
+    # attacks in the first round of that row
+    top_attacks_first = []
+    teams = []
 
     if len(game_phase) <= 0:
-        return pd.DataFrame()
+        return empty_frame(round_result_schema, index_cols)
 
-    for phase, row in zip(["Normal", "Overtime"], game_phase):
+    for row in game_phase[:2]:
         for round in (
             rounds := row.css("div.vlr-rounds-row-col[title]:not(.mod-spacing)")
         ):
@@ -101,91 +317,79 @@ def extract_round_result_from_html(
                 .removesuffix(".webp")
             )
 
-            round_num = int(round.css_first("div.rnd-num").text(strip=True))
+            round_nums.append(round.css_first("div.rnd-num").text(strip=True))
+            winning_sides.append(winning_side)
+            reasons.append(win_reason)
+            scores.append(current_score)
 
-            data.append(
-                [phase, int(round_num), winning_side, win_reason, current_score]
-            )
+        if not teams:
+            teams = [team.text(strip=True) for team in row.css("div.team")]
 
-        team_order = row.css("div.team")
+        # the first round's winner square tells which side its team was on
         first_win = rounds[0].css("div.rnd-sq")
-
-        win_order = 0
-        if "mod-win" in first_win[0].attributes.get("class"):
-            win_order = 0
-        else:
-            win_order = 1
-
-        start_side = "Attack"
-        if "mod-t" in first_win[win_order].attributes.get("class"):
-            start_side = "Attack"
-        else:
-            start_side = "Defense"
-
-        phase_side[phase] = {
-            team_order[win_order].text(strip=True): start_side,
-            team_order[0 if win_order else 1].text(strip=True): opp_side[start_side],
-        }
-
-    round_result = pd.DataFrame(
-        data, columns=["phase", "round_num", "winning_side", "reason", "current_score"]
+        win_order = 0 if "mod-win" in first_win[0].attributes.get("class") else 1
+        winner_attacks = "mod-t" in first_win[win_order].attributes.get("class")
+        top_attacks_first.append(winner_attacks == (win_order == 0))
+
+    round_result = typed_frame(
+        {
+            "round_num": round_nums,
+            "winning_side": winning_sides,
+            "reason": reasons,
+            "current_score": scores,
+            "game_id": game_id,
+            "map": map_name,
+        },
+        round_result_schema,
+        len(round_nums),
     )
 
-    round_result.loc[:, "game_id"] = [game_id] * len(round_result)
-    round_result.loc[:, "map"] = [map_name] * len(round_result)
-
-    round_result.loc[:11, "phase"] = "first_half"
-    round_result.loc[12 : min(round_result["round_num"].max(), 23), "phase"] = (
-        "second_half"
+    # sides swap after round 12 and then every overtime round, so every
+    # round's sides follow from its number and the side of the first round
+    # of its row
+    round_num = round_result["round_num"].to_numpy()
+    overtime = round_num > 24
+    regulation_first, overtime_first = top_attacks_first[0], top_attacks_first[-1]
+    swapped = np.where(overtime, (round_num - 25) % 2 == 1, round_num > 12)
+    top_attacks = np.where(overtime, overtime_first, regulation_first) ^ swapped
+
+    top_team, bottom_team = teams
+    atk_team = np.where(top_attacks, top_team, bottom_team).astype(object)
+    def_team = np.where(top_attacks, bottom_team, top_team).astype(object)
+
+    round_result["phase"] = np.where(
+        overtime,
+        np.char.add("overtime_", (round_num - 24).astype(str)),
+        np.where(round_num > 12, "second_half", "first_half"),
+    ).astype(object)
+    round_result["atk_team"] = atk_team
+    round_result["def_team"] = def_team
+    round_result["winning_team"] = np.where(
+        round_result["winning_side"].to_numpy() == "atk", atk_team, def_team
     )
+    round_result = round_result[list(round_result_schema)]
 
-    if len(round_result) > 24:
-        round_result.loc[24:, "phase"] = [
-            f"overtime_{i}" for i in range(1, len(round_result) - 24 + 1)
-        ]
+    if len(round_result) < 13:
+        return empty_frame(round_result_schema, index_cols)
 
-    game_phase_side = dict()
-    game_phase_side["second_half"] = {
-        k: opp_side[v] for k, v in phase_side["Normal"].items()
-    } | {opp_side[v]: k for k, v in phase_side["Normal"].items()}
+    return round_result.set_index(index_cols)
 
-    game_phase_side["first_half"] = phase_side["Normal"] | {
-        v: k for k, v in phase_side["Normal"].items()
-    }
-    if "Overtime" in phase_side:
-        game_phase_side["overtime_1"] = phase_side["Overtime"] | {
-            v: k for k, v in phase_side["Overtime"].items()
-        }
-
-        for ot in range(2, len(round_result) - 24 + 1):
-            if ot % 2 == 0:
-                game_phase_side[f"overtime_{ot}"] = {
-                    k: opp_side[v] for k, v in phase_side["Overtime"].items()
-                } | {opp_side[v]: k for k, v in phase_side["Overtime"].items()}
-            else:
-                game_phase_side[f"overtime_{ot}"] = phase_side["Overtime"] | {
-                    v: k for k, v in phase_side["Overtime"].items()
-                }
 
-    round_result.loc[:, "atk_team"] = round_result["phase"].map(
-        lambda p: game_phase_side[p]["Attack"]
-    )
-    round_result.loc[:, "def_team"] = round_result["phase"].map(
-        lambda p: game_phase_side[p]["Defense"]
-    )
-    round_result.loc[:, "winning_team"] = vectorized_lookup(
-        round_result, "winning_side", "_team"
+def extract_overview_from_html(
+    html: Union[str, Node], map_name: str, game_id: int
+) -> pd.DataFrame:
+    columns, schema = read_overview_columns(html, map_name, game_id)
+    return typed_frame(columns, schema, len(columns["name"])).set_index(
+        overview_index
     )
 
-    index_cols = ["game_id", "map", "phase", "round_num"]
-    if len(round_result) < 13:
-        return pd.DataFrame(columns=round_result.columns).set_index(index_cols)
-
-    return round_result.set_index(index_cols)
-
 
-def extract_overview_from_html(html: str, map_name: str, game_id: int) -> pd.DataFrame:
-    tree = HTMLParser(html)
+def read_overview_columns(
+    html: Union[str, Node], map_name: str, game_id: int
+) -> tuple[dict[str, list], dict[str, str]]:
+    """Raw column buffers (cell text) of one overview table and the schema to
+    convert them with. Tables without exactly 5 players give no rows."""
+    tree = as_tree(html)
     side_list = ["all", "atk", "def"]
     headers = [th.text(strip=True) for th in tree.css("table thead tr th")][2:]
     headers[-1] = "F" + headers[-1]
@@ -195,23 +399,18 @@ def extract_overview_from_html(html: str, map_name: str, game_id: int) -> pd.Dat
         for header in headers:
             side_stat_cols.append(f"{header}_{side}")
 
-    all_columns = ["game_id", "map", "team", "name", "agent"] + side_stat_cols
-
-    data_rows = []
+    # cells are collected column by column as raw text and converted once
+    # per column at the end
+    stat_values: dict[str, list[Optional[str]]] = {col: [] for col in side_stat_cols}
+    names, teams, agents = [], [], []
 
     for tr in tree.css("table tbody tr"):
-        name = tr.css_first("div.text-of").text(strip=True)
-        team = tr.css_first("div.ge-text-light").text(strip=True)
+        names.append(tr.css_first("div.text-of").text(strip=True))
+        teams.append(tr.css_first("div.ge-text-light").text(strip=True))
         agent_elem = tr.css_first("img")
-        agent = agent_elem.attributes.get("alt", None) if agent_elem else None
+        agents.append(agent_elem.attributes.get("alt", None) if agent_elem else None)
 
-        row_data = {
-            "game_id": game_id,
-            "map": map_name,
-            "team": team,
-            "name": name,
-            "agent": agent,
-        }
+        row_data = dict.fromkeys(side_stat_cols)
 
         for idx, td in enumerate(tr.css("td:not(.mod-player):not(.mod-agents)")):
             if idx >= len(headers):
@@ -234,23 +433,32 @@ def extract_overview_from_html(html: str, map_name: str, game_id: int) -> pd.Dat
                     side = "def"
 
                 if side:
-                    column_name = f"{col}_{side}"
-                    row_data[column_name] = detect_type(span.text(strip=True))
-
-        data_rows.append(row_data)
-
-    result = pd.DataFrame(data_rows, columns=all_columns)
-
-    index_cols = ["game_id", "map", "team", "name"]
-    result.rename(columns={col: col.lower() for col in result.columns}, inplace=True)
-    if len(result) != 5:
-        return pd.DataFrame(columns=result.columns).set_index(index_cols)
+                    row_data[f"{col}_{side}"] = span.text(strip=True)
+
+        for column_name, value in row_data.items():
+            stat_values[column_name].append(value)
+
+    rows = slice(None) if len(names) == 5 else slice(0)
+    columns = {
+        "game_id": [game_id] * len(names[rows]),
+        "map": [map_name] * len(names[rows]),
+        "team": teams[rows],
+        "name": names[rows],
+        "agent": agents[rows],
+    }
+    schema = dict(overview_schema)
+    for column_name, values in stat_values.items():
+        header = column_name.rsplit("_", 1)[0].lower()
+        columns[column_name.lower()] = values[rows]
+        schema[column_name.lower()] = stat_schema.get(header, "number")
 
-    return result.set_index(index_cols)
+    return columns, schema
 
 
-def extract_economy_from_html(html: str, map_name: str, game_id: int) -> pd.DataFrame:
-    tree = HTMLParser(html)
+def extract_economy_from_html(
+    html: Union[str, Node], map_name: str, game_id: int
+) -> pd.DataFrame:
+    tree = as_tree(html)
     divs = tree.css('div[style*="overflow-x: auto"]')
 
     get_buy_type = lambda sign: (
@@ -261,16 +469,17 @@ def extract_economy_from_html(html: str, map_name: str, game_id: int) -> pd.Data
         .replace("$", "semi-eco")
     )
 
+    index_cols = ["game_id", "map", "phase", "round_num"]
     if len(divs) < 2:
-        return pd.DataFrame()
+        return empty_frame(economy_schema, index_cols)
     div = divs[1]
 
     if div is None:
-        return pd.DataFrame()
+        return empty_frame(economy_schema, index_cols)
 
     econ_table = div.css_first("table.wf-table-inset.mod-econ")
     rows = econ_table.css("tr")
-    data_rows = []
+    phases, round_nums, atk_buytypes, def_buytypes = [], [], [], []
 
     round_adder = 0
     phase = ["first_half", "second_half", "overtime"]
@@ -293,24 +502,28 @@ def extract_economy_from_html(html: str, map_name: str, game_id: int) -> pd.Data
             else:
                 phase_str = phase
             boxes = win.css("div.rnd-sq")
-            data_rows.append(
-                {
-                    "game_id": game_id,
-                    "map": map_name,
-                    "phase": phase_str,
-                    "round_num": round_num + round_adder,
-                    "atk_buytype": get_buy_type(boxes[attacker_on].text(strip=True)),
-                    "def_buytype": get_buy_type(boxes[defender_on].text(strip=True)),
-                }
-            )
+            phases.append(phase_str)
+            round_nums.append(round_num + round_adder)
+            atk_buytypes.append(get_buy_type(boxes[attacker_on].text(strip=True)))
+            def_buytypes.append(get_buy_type(boxes[defender_on].text(strip=True)))
             overtime_counter += 1
         round_adder += 12
 
-    index_cols = ["game_id", "map", "phase", "round_num"]
-    econ_df = pd.DataFrame(data_rows)
+    econ_df = typed_frame(
+        {
+            "game_id": game_id,
+            "map": map_name,
+            "phase": phases,
+            "round_num": round_nums,
+            "atk_buytype": atk_buytypes,
+            "def_buytype": def_buytypes,
+        },
+        economy_schema,
+        len(phases),
+    )
 
     if len(econ_df) < 13:
-        return pd.DataFrame(columns=econ_df.columns).set_index(index_cols)
+        return empty_frame(economy_schema, index_cols)
 
     econ_df.loc[0, ["atk_buytype", "def_buytype"]] = ["pistol"] * 2
     econ_df.loc[12, ["atk_buytype", "def_buytype"]] = ["pistol"] * 2
@@ -323,20 +536,120 @@ def scrape_match_info(
     match_url: str,
     team_abbreviate: dict[str, str],
     url: str = "https://www.vlr.gg/",
+    match_cache: Optional[MatchCache] = None,
 ) -> Optional[Match]:
+    if match_cache is not None:
+        cached = match_cache.get(match_id_from_url(match_url, url))
+        if cached is not None:
+            return bind_team_abbreviation(cached, team_abbreviate)
+
+    pages = fetch_match_pages(_session, match_url)
+    if pages is None:
+        return None
+    match_text, econ_text = pages
+
+    if match_cache is None:
+        return parse_match_info(
+            match_text,
+            econ_text,
+            match_url=match_url,
+            team_abbreviate=team_abbreviate,
+            url=url,
+        )
+
+    # cached matches are stored unbound (raw pick/ban names) since the same
+    # match gets scraped for different matchups with different abbreviations
+    match = parse_match_info(
+        match_text,
+        econ_text,
+        match_url=match_url,
+        team_abbreviate=None,
+        url=url,
+    )
+    return cache_match(match, match_text, team_abbreviate, match_cache)
+
+
+def fetch_match_pages(
+    _session: requests.Session, match_url: str
+) -> Optional[tuple[str, str]]:
     try:
-        match_response = _session.get(match_url)
-        econ_response = _session.get(f"{match_url}?game=all&tab=economy")
+        match_response, econ_response = get_concurrently(
+            throttled(_session), match_url, f"{match_url}?game=all&tab=economy"
+        )
         match_response.raise_for_status()
         econ_response.raise_for_status()
     except requests.RequestException as e:
         print(f"Error fetching page: {e}")
         return None
 
-    match_id = int(match_url.removeprefix(url).split("/")[0])
+    return match_response.text, econ_response.text
+
+
+def cache_match(
+    match: Optional[Match],
+    match_text: str,
+    team_abbreviate: dict[str, str],
+    match_cache: MatchCache,
+) -> Optional[Match]:
+    if match is None:
+        return None
+    if is_final_match_page(match_text):
+        match_cache.put(match)
+    return bind_team_abbreviation(match, team_abbreviate)
+
+
+def bind_team_abbreviation(match: Match, team_abbreviate: dict[str, str]) -> Match:
+    """`match` with its pick/ban rows mapped through `team_abbreviate`. Always
+    maps from the raw team tags, so a match bound for another matchup can be
+    bound again."""
+    pick_ban = match.raw_pick_ban
+    if not pick_ban.empty:
+        pick_ban = pick_ban.set_axis(
+            pick_ban.index.map(lambda name: team_abbreviate.get(name))
+        )
+    return _with_pick_ban(match, team_abbreviate, pick_ban)
+
 
-    match_html = HTMLParser(match_response.text)
-    econ_html = HTMLParser(econ_response.text)
+def unbind_team_abbreviation(match: Match) -> Match:
+    """`match` as parsed with `team_abbreviate=None`, the form the caches keep."""
+    return _with_pick_ban(match, {}, match.raw_pick_ban)
+
+
+def _with_pick_ban(
+    match: Match, team_abbreviate: dict[str, str], pick_ban: pd.DataFrame
+) -> Match:
+    return Match(
+        match_id=match.match_id,
+        patch=match.patch,
+        teams=match.teams,
+        event_name=match.event_name,
+        stage_name=match.stage_name,
+        match_date=match.match_date,
+        match_result=match.match_result,
+        team_abbreviation=team_abbreviate,
+        winner=match.winner,
+        match_url=match.match_url,
+        pick_ban=pick_ban,
+        games=match.games,
+        raw_pick_ban=match.raw_pick_ban,
+        final=match.final,
+    )
+
+
+def parse_match_info(
+    match_text: str,
+    econ_text: str,
+    match_url: str,
+    team_abbreviate: Optional[dict[str, str]],
+    url: str = "https://www.vlr.gg/",
+) -> Optional[Match]:
+    """Builds a `Match` from the match page and its economy tab. With
+    `team_abbreviate=None` pick/ban rows keep the raw team tag from the page
+    instead of the mapped name, see `bind_team_abbreviation`."""
+    match_id = match_id_from_url(match_url, url)
+
+    match_html = HTMLParser(match_text)
+    econ_html = HTMLParser(econ_text)
 
     # --- 2. Crucial Data Scraping and Validation ---
     teams_node = match_html.css_first("title")
@@ -401,7 +714,7 @@ def scrape_match_info(
                 if ban_list[-1].lower() == "remains":
                     continue
                 name, act, mapp = ban_list
-                pick_ban_data.append([team_abbreviate.get(name), act, mapp])
+                pick_ban_data.append([name, act, mapp])
             pick_ban_df = pd.DataFrame(pick_ban_data, columns=["team", "action", "map"])
             pick_ban_df.set_index("team", inplace=True)
         except Exception as e:
@@ -450,22 +763,28 @@ def scrape_match_info(
 
         div_econ = econ_html.css_first(f'div.vm-stats-game[data-game-id="{map_id}"]')
 
-        econ_df = extract_economy_from_html(div_econ.html, map_name, int(map_id))
+        econ_df = extract_economy_from_html(div_econ, map_name, int(map_id))
 
         # Assume extract_round_result_from_html and extract_df_from_html are robust
         round_result_df = extract_round_result_from_html(
-            div_map.html, map_name, int(map_id)
+            div_map, map_name, int(map_id)
         )
 
-        stat_tables = div_map.css("table.wf-table-inset.mod-overview")
-        overview_df = pd.DataFrame()
-        for table in stat_tables:
-            overview_df = pd.concat(
-                [
-                    overview_df,
-                    extract_overview_from_html(table.html, map_name, int(map_id)),
-                ]
-            )
+        # both teams' tables go into one set of column buffers, so the map's
+        # overview is converted and indexed once
+        overview_columns: dict[str, list] = {}
+        overview_types = dict(overview_schema)
+        for table in div_map.css("table.wf-table-inset.mod-overview"):
+            columns, schema = read_overview_columns(table, map_name, int(map_id))
+            for column_name, values in columns.items():
+                overview_columns.setdefault(column_name, []).extend(values)
+            overview_types |= schema
+        if overview_columns:
+            overview_df = typed_frame(
+                overview_columns, overview_types, len(overview_columns["name"])
+            ).set_index(overview_index)
+        else:
+            overview_df = empty_frame(overview_schema, overview_index)
 
         if len(round_result_df) != len(econ_df):
             continue
@@ -495,7 +814,7 @@ def scrape_match_info(
     games = Games(games_data)
 
     # --- 6. Return Pydantic Object ---
-    return Match(
+    match = Match(
         match_id=match_id,
         patch=patch,
         teams=teams,
@@ -503,9 +822,13 @@ def scrape_match_info(
         stage_name=stage_name,
         match_date=match_date,
         match_result=match_result,
-        team_abbreviation=team_abbreviate,
+        team_abbreviation={},
         winner=max(match_result, key=match_result.get),
         match_url=match_url,
         pick_ban=pick_ban_df,
         games=games,
+        final=is_final_match_page(match_text),
     )
+    if team_abbreviate is None:
+        return match
+    return bind_team_abbreviation(match, team_abbreviate)
@@ -0,0 +1,165 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import time
+import requests
+from pathlib import Path
+from typing import Callable, Optional, Union
+from requests.structures import CaseInsensitiveDict
+from src.scraper.session import SessionWrapper, make_response
+from src.utils import atomic_write
+
+# a ttl is a number of seconds, None for "never expires", or a callable that
+# picks one of those from the page body
+TTL = Union[Optional[float], Callable[[str], Optional[float]]]
+
+MINUTE = 60.0
+HOUR = 60 * MINUTE
+
+
+def default_cache_dir() -> Path:
+    return Path(
+        os.environ.get(
+            "VLRINSPECT_CACHE_DIR", Path.home() / ".cache" / "vlrinspect"
+        )
+    )
+
+
+def is_final_match_page(html: str) -> bool:
+    return re.search(r'class="match-header-vs-note">\s*final\s*<', html) is not None
+
+
+def match_page_ttl(html: str) -> Optional[float]:
+    # a finished match page never changes again, anything else (upcoming or
+    # live) is worth a re-check every few minutes
+    if is_final_match_page(html):
+        return None
+    return 5 * MINUTE
+
+
+DEFAULT_TTLS: list[tuple[str, TTL]] = [
+    (r"/team/matches/", 30 * MINUTE),
+    (r"^https?://[^/]+/\d+/", match_page_ttl),
+    (r"^https?://[^/]+/?$", 5 * MINUTE),
+]
+
+
+class HttpCache:
+    """On-disk store of response bodies keyed by url.
+
+    Each entry is a gzipped body plus a small json file holding the status,
+    headers and fetch time. `ttls` is an ordered list of (regex, ttl) rules;
+    the first pattern found in the url decides how long an entry stays fresh
+    before it has to be revalidated, otherwise `default_ttl` applies.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path, None] = None,
+        ttls: Optional[list[tuple[str, TTL]]] = None,
+        default_ttl: Optional[float] = 10 * MINUTE,
+    ):
+        self.directory = Path(directory or default_cache_dir() / "http")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttls = [
+            (re.compile(pattern), ttl)
+            for pattern, ttl in (DEFAULT_TTLS if ttls is None else ttls)
+        ]
+        self.default_ttl = default_ttl
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        folder = self.directory / key[:2]
+        return folder / f"{key}.json", folder / f"{key}.html.gz"
+
+    def ttl_for(self, url: str, body: str) -> Optional[float]:
+        for pattern, ttl in self.ttls:
+            if pattern.search(url):
+                return ttl(body) if callable(ttl) else ttl
+        return self.default_ttl
+
+    def load(self, url: str) -> Optional[tuple[dict, bytes]]:
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+            body = gzip.decompress(body_path.read_bytes())
+        except (OSError, ValueError, EOFError):
+            return None
+        return meta, body
+
+    def store(self, url: str, response: requests.Response) -> None:
+        headers = {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower() not in {"content-encoding", "content-length", "transfer-encoding"}
+        }
+        meta = {
+            "url": url,
+            "status_code": response.status_code,
+            "encoding": response.encoding,
+            "headers": headers,
+            "fetched_at": time.time(),
+            "ttl": self.ttl_for(url, response.text),
+        }
+        meta_path, body_path = self._paths(url)
+        meta_path.parent.mkdir(exist_ok=True)
+        atomic_write(body_path, gzip.compress(response.content, compresslevel=6))
+        atomic_write(meta_path, json.dumps(meta).encode())
+
+    def touch(self, url: str, meta: dict) -> None:
+        meta["fetched_at"] = time.time()
+        meta_path, _ = self._paths(url)
+        atomic_write(meta_path, json.dumps(meta).encode())
+
+    @staticmethod
+    def is_fresh(meta: dict) -> bool:
+        ttl = meta.get("ttl")
+        return ttl is None or time.time() - meta["fetched_at"] < ttl
+
+
+def _cached_response(url: str, meta: dict, body: bytes) -> requests.Response:
+    return make_response(
+        url, body, meta["status_code"], meta["headers"], meta["encoding"]
+    )
+
+
+class CachedSession(SessionWrapper):
+    """Serves `get` from an `HttpCache`. Fresh entries never touch the
+    network; stale ones are revalidated with If-None-Match/If-Modified-Since
+    and a 304 just refreshes the entry. Only 200 responses are stored."""
+
+    def __init__(self, session: requests.Session, cache: Optional[HttpCache] = None):
+        super().__init__(session)
+        self.cache = cache if cache is not None else HttpCache()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        if kwargs.get("params"):
+            return self._session.get(url, **kwargs)
+
+        cached = self.cache.load(url)
+        if cached is not None:
+            meta, body = cached
+            if self.cache.is_fresh(meta):
+                return _cached_response(url, meta, body)
+
+            headers = dict(kwargs.pop("headers", None) or {})
+            validators = CaseInsensitiveDict(meta["headers"])
+            etag = validators.get("ETag")
+            last_modified = validators.get("Last-Modified")
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+            response = self._session.get(url, headers=headers, **kwargs)
+            if response.status_code == 304:
+                self.cache.touch(url, meta)
+                return _cached_response(url, meta, body)
+        else:
+            response = self._session.get(url, **kwargs)
+
+        if response.status_code == 200:
+            self.cache.store(url, response)
+        return response
@@ -0,0 +1,85 @@
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Optional, Union
+from src.models import Match, Matches, MatchHistory
+from src.scraper.http_cache import default_cache_dir
+from src.utils import atomic_write
+
+
+class MatchCache:
+    """Pickled `Match` objects on disk, one file per match id.
+
+    Entries live under a folder named after the parser version, so bumping
+    `PARSER_VERSION` in `history.py` invalidates everything parsed by an
+    older parser without having to clear the cache by hand.
+    """
+
+    def __init__(self, directory: Union[str, Path, None] = None, version: Optional[int] = None):
+        from src.scraper.history import PARSER_VERSION
+
+        self.version = PARSER_VERSION if version is None else version
+        self.directory = Path(directory or default_cache_dir() / "matches") / f"v{self.version}"
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, match_id: int) -> Path:
+        return self.directory / f"{match_id}.pkl"
+
+    def get(self, match_id: int) -> Optional[Match]:
+        try:
+            with open(self._path(match_id), "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+
+    def put(self, match: Match) -> None:
+        atomic_write(
+            self._path(match.match_id),
+            pickle.dumps(match, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+
+    def __contains__(self, match_id: int) -> bool:
+        return self._path(match_id).exists()
+
+
+class HistoryStore:
+    """Last scraped `MatchHistory` of every team, keyed by the team's match
+    list url, so the next scrape of that team can be incremental. Only
+    finished matches are kept, and it's versioned like `MatchCache` since the
+    stored matches carry parsed frames too."""
+
+    def __init__(self, directory: Union[str, Path, None] = None, version: Optional[int] = None):
+        from src.scraper.history import PARSER_VERSION
+
+        self.version = PARSER_VERSION if version is None else version
+        self.directory = Path(directory or default_cache_dir() / "histories") / f"v{self.version}"
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, team_url: str) -> Path:
+        return self.directory / f"{hashlib.sha256(team_url.encode()).hexdigest()}.pkl"
+
+    def get(self, team_url: str) -> Optional[MatchHistory]:
+        try:
+            with open(self._path(team_url), "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+
+    def put(self, team_url: str, history: MatchHistory) -> None:
+        from src.scraper.history import unbind_team_abbreviation
+
+        # a fresh instance so the cached_property frames aren't pickled too;
+        # like in `MatchCache` only finished matches are kept, unbound, the
+        # next scrape binds them to its own matchup
+        matches = Matches(
+            [
+                unbind_team_abbreviation(match)
+                for match in history.matches
+                if match.final
+            ]
+        )
+        history = MatchHistory(history.full_name, history.short_name, matches)
+        atomic_write(
+            self._path(team_url),
+            pickle.dumps(history, protocol=pickle.HIGHEST_PROTOCOL),
+        )
@@ -0,0 +1,161 @@
+import os
+import sys
+import requests
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+from src.models import Match, Matches, MatchHistory
+from src.scraper.concurrency import limit_per_host, ordered_map
+from src.scraper.history import (
+    bind_team_abbreviation,
+    cache_match,
+    fetch_match_pages,
+    final_matches,
+    match_id_from_url,
+    parse_match_info,
+)
+from src.scraper.match_cache import MatchCache
+
+# Two stage variant of iter_matches for bulk scrapes: threads only download
+# pages while a process pool does the parsing, which the GIL would otherwise
+# serialize no matter how many fetch threads run.
+
+
+def iter_matches_pipelined(
+    _session: requests.Session,
+    matches_url: Iterable[str],
+    head: int,
+    team_abbreviate: dict[str, str],
+    url: str = "https://www.vlr.gg/",
+    fetch_workers: int = 8,
+    parse_workers: Optional[int] = None,
+    queue_size: Optional[int] = None,
+    max_per_host: Optional[int] = None,
+    parse_executor: Optional[Executor] = None,
+    match_cache: Optional[MatchCache] = None,
+    known: Optional[MatchHistory] = None,
+) -> Iterator[Match]:
+    """Same contract as `iter_matches`: yields the first `head` matches that
+    scrape successfully, in list order.
+
+    `fetch_workers` threads download match/economy pages and hand them to
+    `parse_workers` processes (default: one per core) through a queue of at
+    most `queue_size` pages (default: twice `parse_workers`). When the queue
+    is full the fetch stage stalls until a parse finishes.
+    """
+    if head == -1:
+        head = sys.maxsize
+    parse_workers = parse_workers or os.cpu_count() or 1
+    queue_size = queue_size or 2 * parse_workers
+
+    if fetch_workers > 1:
+        _session = limit_per_host(_session, max_per_host)
+
+    known_matches = final_matches(known)
+
+    def fetch(match_url: str) -> tuple[str, Optional[Match], Optional[tuple]]:
+        match_id = match_id_from_url(match_url, url)
+        match = known_matches.get(match_id)
+        if match is None and match_cache is not None:
+            match = match_cache.get(match_id)
+        if match is not None:
+            match = bind_team_abbreviation(match, team_abbreviate)
+        if match is not None:
+            return match_url, match, None
+        return match_url, None, fetch_match_pages(_session, match_url)
+
+    own_executor = parse_executor is None
+    if own_executor:
+        parse_executor = ProcessPoolExecutor(max_workers=parse_workers)
+
+    # entries are (match, None, "") for matches that need no parsing and
+    # (None, future, match page) for ones handed to the parse stage
+    queue: deque[tuple[Optional[Match], Optional[Future], str]] = deque()
+
+    def ready() -> bool:
+        _, parsed, _ = queue[0]
+        return len(queue) > queue_size or parsed is None or parsed.done()
+
+    def pop() -> Optional[Match]:
+        match, parsed, match_text = queue.popleft()
+        if parsed is None:
+            return match
+        match = parsed.result()
+        if match_cache is None:
+            return match
+        return cache_match(match, match_text, team_abbreviate, match_cache)
+
+    try:
+        found = 0
+        remaining = iter(matches_url)
+        while found < head:
+            batch = list(islice(remaining, head - found))
+            if not batch:
+                break
+
+            for match_url, match, pages in ordered_map(
+                fetch, batch, workers=fetch_workers
+            ):
+                if match is not None or pages is None:
+                    queue.append((match, None, ""))
+                else:
+                    match_text, econ_text = pages
+                    parsed = parse_executor.submit(
+                        parse_match_info,
+                        match_text,
+                        econ_text,
+                        match_url=match_url,
+                        team_abbreviate=None if match_cache else team_abbreviate,
+                        url=url,
+                    )
+                    queue.append((None, parsed, match_text))
+
+                while queue and ready():
+                    match = pop()
+                    if match is not None:
+                        found += 1
+                        yield match
+
+            while queue:
+                match = pop()
+                if match is not None:
+                    found += 1
+                    yield match
+    finally:
+        if own_executor:
+            parse_executor.shutdown(wait=False, cancel_futures=True)
+
+
+def scrape_matches_pipelined(
+    _session: requests.Session,
+    matches_url: Iterable[str],
+    head: int,
+    team_abbreviate: dict[str, str],
+    full_name: str,
+    url: str = "https://www.vlr.gg/",
+    fetch_workers: int = 8,
+    parse_workers: Optional[int] = None,
+    queue_size: Optional[int] = None,
+    max_per_host: Optional[int] = None,
+    parse_executor: Optional[Executor] = None,
+    match_cache: Optional[MatchCache] = None,
+    known: Optional[MatchHistory] = None,
+) -> MatchHistory:
+    result = iter_matches_pipelined(
+        _session,
+        matches_url,
+        head=head,
+        team_abbreviate=team_abbreviate,
+        url=url,
+        fetch_workers=fetch_workers,
+        parse_workers=parse_workers,
+        queue_size=queue_size,
+        max_per_host=max_per_host,
+        parse_executor=parse_executor,
+        match_cache=match_cache,
+        known=known,
+    )
+
+    matches = Matches(list(result))
+    return MatchHistory(full_name, team_abbreviate[full_name], matches)
@@ -0,0 +1,134 @@
+"""Keeps the persistent caches warm for the matches on the VLR home page.
+
+    python -m src.scraper.prefetch [--head 10] [--interval 900] [--workers 4] [--once]
+"""
+
+import argparse
+import threading
+import time
+import requests
+from typing import Optional
+from src.scraper import HistoryStore, HttpCache, MatchCache, Scraper, TeamRegistry
+from src.scraper.http_cache import MINUTE
+from src.scraper.throttle import throttled
+from src.scraper.upcoming import parse_upcoming_matches
+
+
+class Prefetcher:
+    """Every `interval` seconds, reads the upcoming matches and scrapes the
+    last `head` matches of both teams of each into `match_cache`,
+    `history_store` and `team_registry`, the stores the app reads from, so
+    picking a match there only has to catch up on what changed since."""
+
+    def __init__(
+        self,
+        _session: requests.Session,
+        head: int = 10,
+        interval: float = 15 * MINUTE,
+        url: str = "https://www.vlr.gg/",
+        workers: int = 4,
+        match_cache: Optional[MatchCache] = None,
+        history_store: Optional[HistoryStore] = None,
+        team_registry: Optional[TeamRegistry] = None,
+    ):
+        self._session = _session
+        self.head = head
+        self.interval = interval
+        self.url = url
+        self.workers = workers
+        self.match_cache = match_cache if match_cache is not None else MatchCache()
+        self.history_store = history_store if history_store is not None else HistoryStore()
+        self.team_registry = team_registry if team_registry is not None else TeamRegistry()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def upcoming_links(self) -> list[str]:
+        # read the page directly, `get_upcoming_matches` may hold it for longer
+        # than a pass
+        response = throttled(self._session).get(self.url)
+        response.raise_for_status()
+        links = [match["link"] for match in parse_upcoming_matches(response.text, self.url)]
+        return list(dict.fromkeys(links))
+
+    def run_once(self) -> int:
+        """One pass over the upcoming matches, returns how many were warmed."""
+        try:
+            links = self.upcoming_links()
+        except requests.RequestException as e:
+            print(f"Error fetching upcoming matches: {e}")
+            return 0
+
+        warmed = 0
+        for link in links:
+            if self._stop.is_set():
+                break
+            try:
+                Scraper.get_team_history(
+                    self._session,
+                    link,
+                    head=self.head,
+                    url=self.url,
+                    workers=self.workers,
+                    match_cache=self.match_cache,
+                    history_store=self.history_store,
+                    team_registry=self.team_registry,
+                )
+                warmed += 1
+            except (requests.RequestException, ValueError, IndexError) as e:
+                print(f"Error prefetching {link}: {e}")
+        return warmed
+
+    def serve_forever(self) -> None:
+        while not self._stop.is_set():
+            start = time.monotonic()
+            warmed = self.run_once()
+            print(f"Prefetched {warmed} matches in {time.monotonic() - start:.0f}s")
+            self._stop.wait(self.interval)
+
+    def start(self) -> "Prefetcher":
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="prefetcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        # finishes the match being scraped, then returns
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "Prefetcher":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--head", type=int, default=10, help="matches per team")
+    parser.add_argument(
+        "--interval", type=float, default=15 * MINUTE, help="seconds between passes"
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--url", default="https://www.vlr.gg/")
+    parser.add_argument("--once", action="store_true", help="run a single pass and exit")
+    args = parser.parse_args()
+
+    session = Scraper.create_session(pool_size=2 * args.workers + 2, cache=HttpCache())
+    prefetcher = Prefetcher(
+        session, head=args.head, interval=args.interval, url=args.url, workers=args.workers
+    )
+    if args.once:
+        print(f"Prefetched {prefetcher.run_once()} matches")
+        return
+    try:
+        prefetcher.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import requests
+from typing import Optional
+from requests.structures import CaseInsensitiveDict
+
+
+class SessionWrapper:
+    """Base for objects that stand in for a `requests.Session`: they override
+    `get` and forward everything else to the wrapped session."""
+
+    # set by wrappers that answer without going to the network, so there is
+    # nothing to throttle
+    offline = False
+
+    def __init__(self, session: requests.Session):
+        self._session = session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self._session.get(url, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self._session, name)
+
+
+def make_response(
+    url: str,
+    body: bytes,
+    status_code: int = 200,
+    headers: Optional[dict[str, str]] = None,
+    encoding: Optional[str] = "utf-8",
+    reason: Optional[str] = None,
+) -> requests.Response:
+    """A response answered locally (from a cache or an archive) instead of
+    downloaded, marked with `from_cache`."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.reason = reason
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.encoding = encoding
+    response._content = body
+    response.from_cache = True
+    return response
@@ -1,12 +1,44 @@
 import requests
+from typing import Optional
 from selectolax.parser import HTMLParser
+from src.scraper.team_registry import TeamRegistry, team_id_from_url
+from src.scraper.throttle import throttled
 
 
 def get_teams_from_match(
-    _session: requests.Session, match_url: str, url: str = "https://www.vlr.gg/"
+    _session: requests.Session,
+    match_url: str,
+    url: str = "https://www.vlr.gg/",
+    team_registry: Optional[TeamRegistry] = None,
 ) -> list[str]:
+    _session = throttled(_session)
     match_response = _session.get(match_url)
-    match_page = HTMLParser(match_response.text)
+    match_response.raise_for_status()
+    teams = parse_team_links(match_response.text)
+
+    def latest_core_link(team: str) -> str:
+        team_response = _session.get(team_matches_url(team, url))
+        team_response.raise_for_status()
+        return parse_latest_core_link(team_response.text)
+
+    result = []
+    for team in teams:
+        if team_registry is None:
+            result.append(url + latest_core_link(team))
+        else:
+            info = team_registry.lookup(
+                team_id_from_url(team), lambda: latest_core_link(team)
+            )
+            result.append(url + info.core_link)
+    return result
+
+
+def team_matches_url(team: str, url: str = "https://www.vlr.gg/") -> str:
+    return url + team.replace("/team/", "/team/matches/")
+
+
+def parse_team_links(html: str) -> list[str]:
+    match_page = HTMLParser(html)
 
     teams = [
         str(team.attributes["href"]) for team in match_page.css("a.match-header-link")
@@ -15,12 +47,15 @@ def get_teams_from_match(
     if len(teams) != 2:
         raise ValueError
 
-    result = []
-    for team in teams:
-        team_response = _session.get(url + team.replace("/team/", "/team/matches/"))
-        team_page = HTMLParser(team_response.text)
-        core_id_element = team_page.css("span.wf-dropdown a[href*='?core_id=']")
+    return teams
 
-        latest_core_id = str(core_id_element[1].attributes["href"])
-        result.append(url + latest_core_id)
-    return result
+
+def parse_latest_core_link(html: str) -> str:
+    team_page = HTMLParser(html)
+    core_id_element = team_page.css("span.wf-dropdown a[href*='?core_id=']")
+
+    return str(core_id_element[1].attributes["href"])
+
+
+def parse_latest_core_id(html: str, url: str = "https://www.vlr.gg/") -> str:
+    return url + parse_latest_core_link(html)
@@ -0,0 +1,93 @@
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional, Union
+from src.scraper.concurrency import SingleFlight
+from src.scraper.http_cache import HOUR, default_cache_dir
+from src.utils import atomic_write
+
+
+class TeamInfo(NamedTuple):
+    team_id: int
+    # relative to the site root, so entries work for any `url`
+    core_link: str
+    updated_at: float = 0.0
+
+
+def team_id_from_url(team_url: str) -> int:
+    """The id in a team, team match list or core url."""
+    found = re.search(r"/team/(?:matches/)?(\d+)", team_url)
+    if found is None:
+        raise ValueError(f"no team id in {team_url}")
+    return int(found.group(1))
+
+
+# lookups in flight, per registry directory, so every registry of a process
+# pointed at the same directory shares them
+_flights: dict[Path, SingleFlight] = {}
+_flights_lock = threading.Lock()
+
+
+def _flight_for(directory: Path) -> SingleFlight:
+    with _flights_lock:
+        if directory not in _flights:
+            _flights[directory] = SingleFlight(forget=True)
+        return _flights[directory]
+
+
+class TeamRegistry:
+    """What's known about every team, one json file per team id.
+
+    Looking up a team's latest roster (core) takes a request to its match
+    list, so the answer is kept for `ttl` seconds and a repeat matchup skips
+    it. Threads looking up the same team at once share one request, also
+    across registries of the same directory.
+    """
+
+    def __init__(
+        self, directory: Union[str, Path, None] = None, ttl: Optional[float] = 6 * HOUR
+    ):
+        self.directory = Path(directory or default_cache_dir() / "teams")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._flight = _flight_for(self.directory.resolve())
+
+    def _path(self, team_id: int) -> Path:
+        return self.directory / f"{team_id}.json"
+
+    def _load(self, team_id: int) -> Optional[TeamInfo]:
+        try:
+            return TeamInfo(**json.loads(self._path(team_id).read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def get(self, team_id: int) -> Optional[TeamInfo]:
+        """The stored entry if it's younger than `ttl`."""
+        info = self._load(team_id)
+        if info is None:
+            return None
+        if self.ttl is not None and time.time() - info.updated_at > self.ttl:
+            return None
+        return info
+
+    def put(self, info: TeamInfo) -> None:
+        atomic_write(self._path(info.team_id), json.dumps(info._asdict()).encode())
+
+    def lookup(self, team_id: int, fetch: Callable[[], str]) -> TeamInfo:
+        """The stored entry, or a new one with the core link `fetch` returns."""
+        info = self.get(team_id)
+        if info is not None:
+            return info
+
+        def resolve() -> TeamInfo:
+            core_link = fetch()
+            info = TeamInfo(team_id, core_link, time.time())
+            self.put(info)
+            return info
+
+        return self._flight.do(team_id, resolve)
+
+    def __contains__(self, team_id: int) -> bool:
+        return self.get(team_id) is not None
@@ -0,0 +1,145 @@
+import asyncio
+import random
+import threading
+import time
+import requests
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from src.scraper.session import SessionWrapper
+
+
+class TokenBucket:
+    """Allows `rate` requests per second on average with bursts of up to
+    `burst`. Callers reserve a token and sleep until it becomes valid, so the
+    same bucket can be shared by threads and by event loops."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        # drain the bucket far enough that nobody gets a token for `seconds`
+        with self._lock:
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        attempts: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 120.0,
+        statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504}),
+    ):
+        self.attempts = max(1, attempts)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = statuses
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        # exponential backoff with full jitter, unless the server told us how
+        # long to wait
+        if retry_after:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return min(seconds, self.max_retry_after)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# shared by every session that doesn't bring its own limiter, so all
+# scrapes in the process draw from one budget
+default_limiter = TokenBucket(rate=8.0, burst=16)
+default_retry = RetryPolicy()
+
+
+class ThrottledSession(SessionWrapper):
+    """Takes a token from `limiter` before every request and retries
+    connection errors and retryable statuses according to `retry`. A 429
+    with Retry-After pauses the whole limiter, not just this request."""
+
+    def __init__(
+        self,
+        session: requests.Session,
+        limiter: Optional[TokenBucket] = None,
+        retry: Optional[RetryPolicy] = None,
+    ):
+        super().__init__(session)
+        self.limiter = limiter or default_limiter
+        self.retry = retry or default_retry
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        for attempt in range(self.retry.attempts):
+            last_attempt = attempt == self.retry.attempts - 1
+            self.limiter.acquire()
+            try:
+                response = self._session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if last_attempt:
+                    raise
+                time.sleep(self.retry.delay(attempt))
+                continue
+
+            if response.status_code not in self.retry.statuses or last_attempt:
+                return response
+
+            delay = self.retry.delay(attempt, response.headers.get("Retry-After"))
+            if response.status_code == 429:
+                # the next acquire() waits out the pause
+                self.limiter.pause(delay)
+            else:
+                time.sleep(delay)
+        return response
+
+
+def throttled(_session: requests.Session) -> requests.Session:
+    """Returns `_session` unchanged if it is already throttled (or offline)
+    somewhere in its wrapper chain, otherwise wraps it with the default
+    limiter."""
+    session = _session
+    while isinstance(session, SessionWrapper):
+        if isinstance(session, ThrottledSession) or session.offline:
+            return _session
+        session = session._session
+    return ThrottledSession(_session)
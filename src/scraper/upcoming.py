@@ -1,18 +1,27 @@
-import streamlit as st
 import requests
 from selectolax.parser import HTMLParser
+from src.scraper.cache import cached
+from src.scraper.http_cache import HOUR
+from src.scraper.throttle import throttled
 
 
-@st.cache_data(ttl=3600)  # Data will be re-scraped after 1 hour (3600 seconds)
+@cached(ttl=HOUR)  # Data will be re-scraped after 1 hour
 def get_upcoming_matches(
     _session: requests.Session, url="https://www.vlr.gg/"
 ) -> list[dict[str, str]]:
 
+    response = throttled(_session).get(url)
+    response.raise_for_status()  # Check for HTTP errors
+    return parse_upcoming_matches(response.text, url)
+
+
+def parse_upcoming_matches(
+    html: str, url: str = "https://www.vlr.gg/"
+) -> list[dict[str, str]]:
+
     upcoming_matches_data = []
 
-    response = _session.get(url)
-    response.raise_for_status()  # Check for HTTP errors
-    tree = HTMLParser(response.text)
+    tree = HTMLParser(html)
 
     elements = tree.css("a.mod-match")
 
@@ -1 +1,2 @@
 from .utils import *
+from .schema import *
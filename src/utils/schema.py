@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+
+# Declared dtypes of the scraped tables. Cells are collected as raw text and
+# each column is converted once, so every frame of a table comes out with the
+# same dtypes and concatenating them never falls back to object.
+#
+# kinds: "int" -> int64, "number" -> float64, "percent" -> float64 fraction,
+#        "str" -> object
+
+overview_index = ["game_id", "map", "team", "name"]
+
+overview_schema = {
+    "game_id": "int",
+    "map": "str",
+    "team": "str",
+    "name": "str",
+    "agent": "str",
+}
+
+# per stat, every stat is scraped once per side (`{stat}_{all|atk|def}`)
+stat_schema = {
+    "r2.0": "number",
+    "acs": "number",
+    "k": "number",
+    "d": "number",
+    "a": "number",
+    "+/–": "number",
+    "kast": "percent",
+    "adr": "number",
+    "hs%": "percent",
+    "fk": "number",
+    "fd": "number",
+    "f+/–": "number",
+}
+
+round_result_schema = {
+    "game_id": "int",
+    "map": "str",
+    "phase": "str",
+    "round_num": "int",
+    "winning_side": "str",
+    "reason": "str",
+    "current_score": "str",
+    "atk_team": "str",
+    "def_team": "str",
+    "winning_team": "str",
+}
+
+economy_schema = {
+    "game_id": "int",
+    "map": "str",
+    "phase": "str",
+    "round_num": "int",
+    "atk_buytype": "str",
+    "def_buytype": "str",
+}
+
+
+def to_numbers(values: list, kind: str = "number") -> np.ndarray:
+    # anything that isn't a number ("", "–", missing cells) becomes NaN
+    numbers = pd.to_numeric(
+        pd.Series(
+            [value.rstrip("%") if value else None for value in values],
+            dtype=object,
+        ),
+        errors="coerce",
+    ).to_numpy(dtype="float64")
+    if kind == "percent":
+        return numbers / 100
+    return numbers
+
+
+def to_column(values, kind: str, length: int) -> np.ndarray:
+    if isinstance(values, (str, int, float)) or values is None:
+        values = [values] * length
+    if kind == "int":
+        return np.asarray(values, dtype="int64")
+    if kind in ("number", "percent"):
+        if isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+            return values.astype("float64")
+        return to_numbers(values, kind)
+    return np.asarray(values, dtype=object)
+
+
+def typed_frame(columns: dict, schema: dict[str, str], length: int) -> pd.DataFrame:
+    """Builds a frame from raw column buffers (lists of cell text, arrays or
+    scalars to broadcast), converting each column to the dtype `schema`
+    declares for it."""
+    return pd.DataFrame(
+        {
+            name: to_column(values, schema[name], length)
+            for name, values in columns.items()
+        },
+        index=pd.RangeIndex(length),
+    )
+
+
+def empty_frame(schema: dict[str, str], index_cols: list[str]) -> pd.DataFrame:
+    return typed_frame(
+        {name: [] for name in schema}, schema, 0
+    ).set_index(index_cols)
+
+
+def concat_frames(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Same result as `pd.concat(frames)`, for many small frames of one
+    table. pandas spends most of such a concat merging the MultiIndexes, so
+    the data is concatenated without them and the index is built once from
+    the level values."""
+    if not frames or not all(
+        isinstance(frame.index, pd.MultiIndex)
+        and frame.index.names == frames[0].index.names
+        for frame in frames
+    ):
+        return pd.concat(frames)
+
+    names = frames[0].index.names
+    levels = [
+        np.concatenate(
+            [
+                frame.index.levels[i]
+                .take(frame.index.codes[i], allow_fill=True)
+                .to_numpy()
+                for frame in frames
+            ]
+        )
+        for i in range(len(names))
+    ]
+    result = pd.concat(frames, ignore_index=True)
+    result.index = pd.MultiIndex.from_arrays(levels, names=names)
+    return result
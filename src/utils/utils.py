@@ -1,4 +1,6 @@
+import os
 import re
+import threading
 import pandas as pd
 from selectolax.parser import HTMLParser
 import numpy as np
@@ -23,27 +25,12 @@ def vectorized_lookup(df: pd.DataFrame, selector_column: str, target_suffix: str
     return target_values[row_indices, column_indices]
 
 
-def detect_type(value: str):
-    if value.lower() in {"none", "null", "nil"}:
-        return None
-
-    if value.lower() in {"true", "false"}:
-        return value.lower() == "true"
-
-    try:
-        return int(value)
-    except ValueError:
-        pass
-
-    try:
-        return float(value)
-    except ValueError:
-        pass
-
-    if "%" in value:
-        return int(value.replace("%", "")) / 100
-
-    return value
+def atomic_write(path, data: bytes) -> None:
+    # write next to the target then rename, so concurrent readers never see
+    # a half written file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
 
 
 stat_cols = {
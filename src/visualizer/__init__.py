@@ -1,73 +1,99 @@
-from .logic.overview import (
-    get_team_pistol_impact,
-    get_team_win_lose,
-    get_team_buy_type_win_lose,
-    get_team_win_condition,
-)
-
-from .logic.player import (
-    get_players_agent_pool,
-    get_player_stats,
-    get_player_stat_history,
-)
-
-from .overview import (
-    plot_team_win_condition,
-    plot_team_win_lose,
-    plot_team_buy_type_win_lose,
-    plot_team_poistol_impact,
-)
-
-from .player import plot_players_agent_pool, plot_player_stats, plot_player_stat_history
-
-from .logic.map import (
-    get_team_pick_ban,
-    get_team_side_bias,
-    get_map_pistol_impact,
-    get_players_map_agent_pool,
-)
-from .map import (
-    plot_team_pick_ban,
-    plot_team_side_bias,
-    plot_map_pistol_impact,
-    plot_players_map_agent_pool,
-)
+from importlib import import_module
+
+# plotly and scikit-learn take longer to import than everything else in the
+# app together, so every function is only imported from its module the
+# first time it's used
+_sources = {
+    # overall
+    "get_team_win_lose": ".logic.overview",
+    "get_team_buy_type_win_lose": ".logic.overview",
+    "get_team_win_condition": ".logic.overview",
+    "get_team_pistol_impact": ".logic.overview",
+    "plot_team_win_lose": ".overview",
+    "plot_team_buy_type_win_lose": ".overview",
+    "plot_team_win_condition": ".overview",
+    "plot_team_poistol_impact": ".overview",
+    # player
+    "get_players_agent_pool": ".logic.player",
+    "get_player_stats": ".logic.player",
+    "get_player_stat_history": ".logic.player",
+    "plot_players_agent_pool": ".player",
+    "plot_player_stats": ".player",
+    "plot_player_stat_history": ".player",
+    # map
+    "get_team_pick_ban": ".logic.map",
+    "get_team_side_bias": ".logic.map",
+    "get_map_pistol_impact": ".logic.map",
+    "get_players_map_agent_pool": ".logic.map",
+    "plot_team_pick_ban": ".map",
+    "plot_team_side_bias": ".map",
+    "plot_map_pistol_impact": ".map",
+    "plot_players_map_agent_pool": ".map",
+}
+
+
+def __getattr__(name: str):
+    if name not in _sources:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_sources[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_sources))
+
+
+class _lazy:
+    """A `Visualizer` staticmethod that imports its function on first use
+    and then replaces itself with it."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __set_name__(self, owner, attr: str):
+        self.attr = attr
+
+    def __get__(self, instance, owner):
+        func = __getattr__(self.name)
+        setattr(owner, self.attr, staticmethod(func))
+        return func
 
 
 class Visualizer:
 
     # overall
-    get_team_win_lose = staticmethod(get_team_win_lose)
-    plot_team_win_lose = staticmethod(plot_team_win_lose)
+    get_team_win_lose = _lazy("get_team_win_lose")
+    plot_team_win_lose = _lazy("plot_team_win_lose")
 
-    get_team_buy_type_win_lose = staticmethod(get_team_buy_type_win_lose)
-    plot_team_buy_type_win_lose = staticmethod(plot_team_buy_type_win_lose)
+    get_team_buy_type_win_lose = _lazy("get_team_buy_type_win_lose")
+    plot_team_buy_type_win_lose = _lazy("plot_team_buy_type_win_lose")
 
-    get_team_win_condition = staticmethod(get_team_win_condition)
-    plot_team_win_condition = staticmethod(plot_team_win_condition)
+    get_team_win_condition = _lazy("get_team_win_condition")
+    plot_team_win_condition = _lazy("plot_team_win_condition")
 
-    get_team_pistol_impact = staticmethod(get_team_pistol_impact)
-    plot_team_pistol_impact = staticmethod(plot_team_poistol_impact)
+    get_team_pistol_impact = _lazy("get_team_pistol_impact")
+    plot_team_pistol_impact = _lazy("plot_team_poistol_impact")
 
     # player
-    get_player_stats = staticmethod(get_player_stats)
-    plot_player_stats = staticmethod(plot_player_stats)
+    get_player_stats = _lazy("get_player_stats")
+    plot_player_stats = _lazy("plot_player_stats")
 
-    get_players_agent_pool = staticmethod(get_players_agent_pool)
-    plot_players_agent_pool = staticmethod(plot_players_agent_pool)
+    get_players_agent_pool = _lazy("get_players_agent_pool")
+    plot_players_agent_pool = _lazy("plot_players_agent_pool")
 
-    get_player_stat_history = staticmethod(get_player_stat_history)
-    plot_player_stat_history = staticmethod(plot_player_stat_history)
+    get_player_stat_history = _lazy("get_player_stat_history")
+    plot_player_stat_history = _lazy("plot_player_stat_history")
 
     # map
-    get_team_pick_ban = staticmethod(get_team_pick_ban)
-    plot_team_pick_ban = staticmethod(plot_team_pick_ban)
+    get_team_pick_ban = _lazy("get_team_pick_ban")
+    plot_team_pick_ban = _lazy("plot_team_pick_ban")
 
-    get_players_map_agent_pool = staticmethod(get_players_map_agent_pool)
-    plot_players_map_agent_pool = staticmethod(plot_players_map_agent_pool)
+    get_players_map_agent_pool = _lazy("get_players_map_agent_pool")
+    plot_players_map_agent_pool = _lazy("plot_players_map_agent_pool")
 
-    get_team_side_bias = staticmethod(get_team_side_bias)
-    plot_team_side_bias = staticmethod(plot_team_side_bias)
+    get_team_side_bias = _lazy("get_team_side_bias")
+    plot_team_side_bias = _lazy("plot_team_side_bias")
 
-    get_map_pistol_impact = staticmethod(get_map_pistol_impact)
-    plot_map_pistol_impact = staticmethod(plot_map_pistol_impact)
+    get_map_pistol_impact = _lazy("get_map_pistol_impact")
+    plot_map_pistol_impact = _lazy("plot_map_pistol_impact")
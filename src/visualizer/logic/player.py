@@ -1,6 +1,5 @@
 from src.models import MatchHistory
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
 
 
 def get_players_agent_pool(matches, apply_composite_scores: bool = False):
@@ -33,6 +32,9 @@ def get_players_agent_pool(matches, apply_composite_scores: bool = False):
         "+/-_all": 0.10,
     }
 
+    # only needed for composite scores and slow to import
+    from sklearn.preprocessing import StandardScaler
+
     scoring_data = agent_stats[all_cols].copy()
     scoring_data = scoring_data.fillna(0)
 
@@ -107,14 +109,12 @@ def get_player_stats(matches: MatchHistory, cat_by: str = "side") -> pd.DataFram
         cat2_id = "def"
 
     player_cat1 = (
-        cat1_df.select_dtypes(exclude="object")
-        .groupby(level="name")
+        cat1_df.groupby(level="name")
         .mean()
         .reset_index()
     )
     player_cat2 = (
-        cat2_df.select_dtypes(exclude="object")
-        .groupby(level="name")
+        cat2_df.groupby(level="name")
         .mean()
         .reset_index()
     )